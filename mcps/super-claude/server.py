@@ -8,6 +8,7 @@ Central MCP with plugin support providing:
 
 from fastmcp import FastMCP
 import subprocess
+import shlex
 import json
 from pathlib import Path
 from datetime import datetime
@@ -32,7 +33,7 @@ try:
         PLUGINS_DIR, CORE_DIR, PROVIDERS_DIR, STORAGE_CONFIG,
         DOCKER_NETWORK, PUBLIC_BASE_URL
     )
-    from shell import run_shell, run_shell_simple, is_command_blocked
+    from shell import run_shell, run_shell_simple, run_argv, is_command_blocked
     SHARED_MODULES_AVAILABLE = True
     logger.info("Shared modules loaded")
 except ImportError as e:
@@ -108,12 +109,13 @@ except ImportError as e:
 # MAIL SERVICE INITIALIZATION
 # =============================================================================
 SERVICES_DIR = SUPER_CLAUDE_ROOT / "mcps" / "super-claude" / "services"
-if str(SERVICES_DIR) not in sys.path:
-    sys.path.insert(0, str(SERVICES_DIR))
+if str(SERVICES_DIR.parent) not in sys.path:
+    sys.path.insert(0, str(SERVICES_DIR.parent))
 
 try:
-    from mail.manager import MailManager
-    from mail.adapters.gmail import GmailAdapter
+    from services.mail.manager import MailManager
+    from services.mail.adapters.gmail import GmailAdapter
+    from services.mail.interface import MessageFlag
     mail_manager = MailManager()
     mail_manager.register_adapter_type("gmail", GmailAdapter)
     MAIL_AVAILABLE = True
@@ -127,8 +129,8 @@ except ImportError as e:
 # CALENDAR SERVICE INITIALIZATION
 # =============================================================================
 try:
-    from calendarservice.manager import CalendarManager
-    from calendarservice.adapters.gcal import GCalAdapter
+    from services.calendarservice.manager import CalendarManager
+    from services.calendarservice.adapters.gcal import GCalAdapter
     calendar_manager = CalendarManager()
     calendar_manager.register_adapter_type("gcal", GCalAdapter)
     CALENDAR_AVAILABLE = True
@@ -142,8 +144,8 @@ except ImportError as e:
 # CONTACTS SERVICE INITIALIZATION
 # =============================================================================
 try:
-    from contacts.manager import ContactsManager
-    from contacts.adapters.gcontacts import GoogleContactsAdapter
+    from services.contacts.manager import ContactsManager
+    from services.contacts.adapters.gcontacts import GoogleContactsAdapter
     contacts_manager = ContactsManager()
     contacts_manager.register_adapter_type("gcontacts", GoogleContactsAdapter)
     CONTACTS_AVAILABLE = True
@@ -305,6 +307,15 @@ def _shell_exec_impl(command: str, timeout: int = 30) -> str:
     except Exception as e:
         return f"❌ Error: {e}"
 
+def _argv_exec_impl(argv: list[str], timeout: int = 30) -> str:
+    """Run a program without a shell - use for commands built from arguments."""
+    if SHARED_MODULES_AVAILABLE:
+        success, output = run_argv(argv, timeout)
+        return output
+    
+    # Fallback: quote each argument for the shell implementation
+    return _shell_exec_impl(shlex.join(argv), timeout)
+
 def _context_load_impl(domain: str) -> str:
     """Context loading implementation - use this from other tools."""
     domain_path = _get_domain_path(domain)
@@ -1106,18 +1117,18 @@ def shell_exec(command: str, timeout: int = 30) -> str:
 @mcp.tool()
 def docker_ps(all: bool = False) -> str:
     """List Docker containers."""
-    flag = "-a" if all else ""
-    return _shell_exec_impl(f"docker ps {flag} --format 'table {{{{.Names}}}}\\t{{{{.Status}}}}\\t{{{{.Ports}}}}'")
+    flag = ["-a"] if all else []
+    return _argv_exec_impl(["docker", "ps", *flag, "--format", "table {{.Names}}\\t{{.Status}}\\t{{.Ports}}"])
 
 @mcp.tool()
 def docker_logs(container: str, lines: int = 50) -> str:
     """Get container logs."""
-    return _shell_exec_impl(f"docker logs --tail {lines} {container}")
+    return _argv_exec_impl(["docker", "logs", "--tail", str(lines), container])
 
 @mcp.tool()
 def docker_restart(container: str) -> str:
     """Restart a container."""
-    result = _shell_exec_impl(f"docker restart {container}")
+    result = _argv_exec_impl(["docker", "restart", container])
     if "Error" not in result:
         return f"✅ Restarted: {container}"
     return result
@@ -1125,7 +1136,7 @@ def docker_restart(container: str) -> str:
 @mcp.tool()
 def docker_stop(container: str) -> str:
     """Stop a container."""
-    result = _shell_exec_impl(f"docker stop {container}")
+    result = _argv_exec_impl(["docker", "stop", container])
     if "Error" not in result:
         return f"✅ Stopped: {container}"
     return result
@@ -1133,7 +1144,7 @@ def docker_stop(container: str) -> str:
 @mcp.tool()
 def docker_start(container: str) -> str:
     """Start a stopped container."""
-    result = _shell_exec_impl(f"docker start {container}")
+    result = _argv_exec_impl(["docker", "start", container])
     if "Error" not in result:
         return f"✅ Started: {container}"
     return result
@@ -1343,7 +1354,7 @@ if MAIL_AVAILABLE:
         lines = [f"📧 Messages in {account}/{folder}", "─" * 40]
         for m in page.messages:
             date_str = m.date.strftime("%m/%d %H:%M") if m.date else ""
-            unread = "●" if any(f.value == "unread" for f in m.flags) else " "
+            unread = "●" if m.flags & MessageFlag.UNREAD else " "
             lines.append(f"{unread} {date_str} | {m.sender.email[:25]:<25} | {m.subject[:40]}")
             lines.append(f"    ID: {m.id}")
         if page.next_cursor:
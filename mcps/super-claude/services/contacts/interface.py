@@ -149,7 +149,7 @@ class ContactPage:
     total_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContactsAccount:
     """A named contacts account configuration."""
     name: str
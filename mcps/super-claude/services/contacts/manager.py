@@ -4,11 +4,14 @@ Contacts Account Manager
 Manages named contacts accounts and adapter instances.
 """
 
-import json
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Type, List
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Set, Type, List
 import logging
 
+from ..servicejson import read_config, write_config
 from .interface import (
     ContactsAdapter, ContactsAccount, Contact, ContactPage, ContactGroup
 )
@@ -17,6 +20,19 @@ logger = logging.getLogger(__name__)
 
 CONFIG_FILE = Path("/data/config/contacts_accounts.json")
 
+_SEP = "─" * 40
+_HDR = ["👤 Contacts Accounts", _SEP]
+_ERR_NO_CONNECT = "❌ Could not connect to account: {}".format
+
+# Shared read-only config for accounts that don't define one
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Config paths that failed to parse, keyed to the mtime seen at the time
+_BAD_CONFIGS: Dict[Path, int] = {}
+
+# Number of connected adapters kept, least recently used evicted first
+ADAPTER_POOL_SIZE = 16
+
 
 class ContactsManager:
     """Manages contacts accounts and adapter instances."""
@@ -24,47 +40,69 @@ class ContactsManager:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or CONFIG_FILE
         self.accounts: Dict[str, ContactsAccount] = {}
-        self.adapters: Dict[str, ContactsAdapter] = {}
+        # Snapshot of account names, rebuilt whenever accounts change
+        self._account_names: FrozenSet[str] = frozenset()
+        # Connected adapters, least recently used first
+        self.adapters: "OrderedDict[str, ContactsAdapter]" = OrderedDict()
+        # Adapter -> calls currently running on it
+        self._in_use: Dict[ContactsAdapter, int] = {}
+        # Evicted adapters to disconnect once their last call finishes
+        self._retired: Set[ContactsAdapter] = set()
+        self._pending_disconnects: Set[asyncio.Task] = set()
         self.adapter_classes: Dict[str, Type[ContactsAdapter]] = {}
         
         self._load_accounts()
     
     def register_adapter_type(self, adapter_type: str, adapter_class: Type[ContactsAdapter]) -> None:
         """Register an adapter implementation."""
-        self.adapter_classes[adapter_type] = adapter_class
-        logger.info(f"✅ Registered contacts adapter: {adapter_type}")
+        self.register_adapter_types({adapter_type: adapter_class})
+    
+    def register_adapter_types(self, mapping: Dict[str, Type[ContactsAdapter]]) -> None:
+        """Register several adapter implementations at once."""
+        self.adapter_classes.update(mapping)
+        logger.info("✅ Registered %d contacts adapters: %s", len(mapping), ", ".join(mapping))
     
     def _load_accounts(self) -> None:
         """Load accounts from config file."""
-        if not self.config_path.exists():
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             logger.info("No contacts accounts config found, starting fresh")
             return
         
+        if st.st_size == 0 or _BAD_CONFIGS.get(self.config_path) == st.st_mtime_ns:
+            return
+        
         try:
-            config = json.loads(self.config_path.read_text())
+            config = read_config(self.config_path)
+            accounts = self.accounts
             for name, data in config.get("accounts", {}).items():
-                self.accounts[name] = ContactsAccount(
-                    name=name,
-                    adapter=data.get("adapter", ""),
-                    credentials_ref=data.get("credentials_ref", ""),
-                    config=data.get("config", {})
+                get = data.get
+                accounts[name] = ContactsAccount(
+                    name,
+                    get("adapter", ""),
+                    get("credentials_ref", ""),
+                    get("config") or _EMPTY_CONFIG
                 )
-            logger.info(f"✅ Loaded {len(self.accounts)} contacts accounts")
+            logger.info("✅ Loaded %d contacts accounts", len(self.accounts))
         except Exception as e:
-            logger.error(f"❌ Failed to load accounts: {e}")
+            _BAD_CONFIGS[self.config_path] = st.st_mtime_ns
+            logger.error("❌ Failed to load accounts: %s", e)
+        finally:
+            # Accounts parsed before a malformed entry stay loaded
+            self._account_names = frozenset(self.accounts)
     
-    def _save_accounts(self) -> None:
-        """Save accounts to config file."""
+    def _save_accounts(self, durable: bool = False) -> None:
+        """Save accounts to config file; fsynced only when ``durable``."""
         config = {"accounts": {}}
         for name, account in self.accounts.items():
             config["accounts"][name] = {
                 "adapter": account.adapter,
                 "credentials_ref": account.credentials_ref,
-                "config": account.config
+                "config": dict(account.config)
             }
         
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        self.config_path.write_text(json.dumps(config, indent=2))
+        write_config(self.config_path, config, durable)
     
     def add_account(
         self,
@@ -85,8 +123,9 @@ class ContactsManager:
             name=name,
             adapter=adapter,
             credentials_ref=credentials_ref,
-            config=config or {}
+            config=config or _EMPTY_CONFIG
         )
+        self._account_names = frozenset(self.accounts)
         self._save_accounts()
         
         return f"✅ Added contacts account: {name} ({adapter})"
@@ -96,10 +135,10 @@ class ContactsManager:
         if name not in self.accounts:
             return f"❌ Account '{name}' not found"
         
-        if name in self.adapters:
-            del self.adapters[name]
+        self.adapters.pop(name, None)
         
         del self.accounts[name]
+        self._account_names = frozenset(self.accounts)
         self._save_accounts()
         
         return f"✅ Removed contacts account: {name}"
@@ -109,26 +148,28 @@ class ContactsManager:
         if not self.accounts:
             return "👤 No contacts accounts configured"
         
-        lines = ["👤 Contacts Accounts", "─" * 40]
-        for name, account in self.accounts.items():
-            connected = "🟢" if name in self.adapters else "⚪"
-            lines.append(f"{connected} {name} ({account.adapter})")
-        
-        return "\n".join(lines)
+        adapters = self.adapters
+        body = [
+            f"{'🟢' if name in adapters else '⚪'} {name} ({account.adapter})"
+            for name, account in self.accounts.items()
+        ]
+        return "\n".join(_HDR + body)
     
     async def get_adapter(self, account_name: str) -> Optional[ContactsAdapter]:
         """Get or create an adapter instance for an account."""
-        if account_name not in self.accounts:
-            logger.error(f"Account not found: {account_name}")
+        if account_name not in self._account_names:
+            logger.error("Account not found: %s", account_name)
             return None
         
-        if account_name in self.adapters:
-            return self.adapters[account_name]
+        adapter = self.adapters.get(account_name)
+        if adapter is not None:
+            self.adapters.move_to_end(account_name)
+            return adapter
         
         account = self.accounts[account_name]
         
         if account.adapter not in self.adapter_classes:
-            logger.error(f"Adapter not registered: {account.adapter}")
+            logger.error("Adapter not registered: %s", account.adapter)
             return None
         
         adapter_class = self.adapter_classes[account.adapter]
@@ -136,10 +177,53 @@ class ContactsManager:
         
         if await adapter.connect():
             self.adapters[account_name] = adapter
+            self._evict()
             return adapter
         
         return None
     
+    def _evict(self) -> None:
+        """
+        Drop the least recently used adapters past ADAPTER_POOL_SIZE.
+        
+        Idle ones are disconnected at once; ones with calls still running
+        are disconnected when the last of those calls finishes.
+        """
+        adapters = self.adapters
+        while len(adapters) > ADAPTER_POOL_SIZE:
+            _, evicted = adapters.popitem(last=False)
+            if self._in_use.get(evicted):
+                self._retired.add(evicted)
+            else:
+                self._disconnect_later(evicted)
+    
+    def _disconnect_later(self, adapter: ContactsAdapter) -> None:
+        """Disconnect an adapter in a background task."""
+        task = asyncio.get_running_loop().create_task(adapter.disconnect())
+        self._pending_disconnects.add(task)
+        task.add_done_callback(self._pending_disconnects.discard)
+    
+    async def _call(self, account_name: str, method_name: str, *args, fallback=None, **kwargs):
+        """Dispatch to the account's adapter, returning ``fallback`` if unavailable.
+
+        Callable fallbacks (e.g. ``_ERR_NO_CONNECT``) are called with the account name.
+        """
+        adapter = await self.get_adapter(account_name)
+        if adapter is None:
+            return fallback(account_name) if callable(fallback) else fallback
+        
+        in_use = self._in_use
+        in_use[adapter] = in_use.get(adapter, 0) + 1
+        try:
+            return await getattr(adapter, method_name)(*args, **kwargs)
+        finally:
+            count = in_use.pop(adapter) - 1
+            if count:
+                in_use[adapter] = count
+            elif adapter in self._retired:
+                self._retired.discard(adapter)
+                self._disconnect_later(adapter)
+    
     # Convenience methods
     
     async def list_contacts(
@@ -149,16 +233,13 @@ class ContactsManager:
         cursor: Optional[str] = None,
         group_id: Optional[str] = None
     ) -> ContactPage:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return ContactPage(contacts=[])
-        return await adapter.list_contacts(limit, cursor, group_id)
+        return await self._call(
+            account_name, "list_contacts", limit, cursor, group_id,
+            fallback=ContactPage(contacts=[])
+        )
     
     async def get_contact(self, account_name: str, contact_id: str) -> Optional[Contact]:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return None
-        return await adapter.get_contact(contact_id)
+        return await self._call(account_name, "get_contact", contact_id)
     
     async def search_contacts(
         self,
@@ -166,10 +247,7 @@ class ContactsManager:
         query: str,
         limit: int = 50
     ) -> List[Contact]:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return []
-        return await adapter.search_contacts(query, limit)
+        return await self._call(account_name, "search_contacts", query, limit, fallback=[])
     
     async def create_contact(
         self,
@@ -182,11 +260,10 @@ class ContactsManager:
         title: Optional[str] = None,
         notes: Optional[str] = None
     ) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.create_contact(
-            given_name, family_name, email, phone, organization, title, notes
+        return await self._call(
+            account_name, "create_contact",
+            given_name, family_name, email, phone, organization, title, notes,
+            fallback=_ERR_NO_CONNECT
         )
     
     async def update_contact(
@@ -195,31 +272,22 @@ class ContactsManager:
         contact_id: str,
         **kwargs
     ) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.update_contact(contact_id, **kwargs)
+        return await self._call(
+            account_name, "update_contact", contact_id, fallback=_ERR_NO_CONNECT, **kwargs
+        )
     
     async def delete_contact(self, account_name: str, contact_id: str) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.delete_contact(contact_id)
+        return await self._call(account_name, "delete_contact", contact_id, fallback=_ERR_NO_CONNECT)
     
     async def list_groups(self, account_name: str) -> List[ContactGroup]:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return []
-        return await adapter.list_groups()
+        return await self._call(account_name, "list_groups", fallback=[])
     
     async def add_to_group(self, account_name: str, contact_id: str, group_id: str) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.add_to_group(contact_id, group_id)
+        return await self._call(
+            account_name, "add_to_group", contact_id, group_id, fallback=_ERR_NO_CONNECT
+        )
     
     async def remove_from_group(self, account_name: str, contact_id: str, group_id: str) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.remove_from_group(contact_id, group_id)
+        return await self._call(
+            account_name, "remove_from_group", contact_id, group_id, fallback=_ERR_NO_CONNECT
+        )
@@ -0,0 +1,131 @@
+"""
+Shared Google API plumbing for the service adapters.
+
+Credentials and built services are cached per process, so adapters for
+the same token file skip the disk read and the discovery build on
+reconnect. Requests run in worker threads, each on its own transport.
+"""
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .servicejson import response_model
+
+logger = logging.getLogger(__name__)
+
+# Credentials per token file, keyed to the file's mtime so a re-auth that
+# rewrites the token is picked up; shared by every adapter that uses it
+_CREDS_CACHE: Dict[Path, Tuple[int, Any]] = {}
+
+# Built services per (API name, version, id(Credentials))
+_SERVICE_CACHE: Dict[Tuple[str, str, int], Any] = {}
+
+# One transport for token refreshes, so they reuse its connection pool
+_refresh_request = None
+
+
+async def load_credentials(token_path: Path) -> Optional[Any]:
+    """
+    Return the credentials stored in a token file, refreshed if expired.
+    
+    A refresh that changes the credentials is written back to the file.
+    Cached credentials are reused only while the file's mtime is
+    unchanged, so rewriting the token file takes effect on the next
+    connect. Returns None when there is no usable token; raises ImportError when
+    the Google client libraries are not installed.
+    """
+    global _refresh_request
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    
+    try:
+        mtime = token_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _forget(token_path)
+        return None
+    
+    cached = _CREDS_CACHE.get(token_path)
+    if cached is not None and cached[0] == mtime:
+        creds = cached[1]
+    else:
+        _forget(token_path)
+        try:
+            creds = Credentials.from_authorized_user_file(str(token_path))
+            logger.info(f"Loaded credentials from {token_path}")
+        except Exception as e:
+            logger.warning(f"Failed to load token file: {e}")
+            return None
+    
+    if not creds:
+        return None
+    
+    if creds.expired and creds.refresh_token:
+        if _refresh_request is None:
+            _refresh_request = Request()
+        before = creds.to_json()
+        await asyncio.to_thread(creds.refresh, _refresh_request)
+        after = creds.to_json()
+        if after != before:
+            with open(token_path, 'w') as f:
+                f.write(after)
+            mtime = token_path.stat().st_mtime_ns
+            logger.info("Token refreshed and saved")
+    
+    _CREDS_CACHE[token_path] = (mtime, creds)
+    return creds
+
+
+def _forget(token_path: Path) -> None:
+    """Drop cached credentials for a token file, and the services built on them."""
+    cached = _CREDS_CACHE.pop(token_path, None)
+    if cached is not None:
+        creds_id = id(cached[1])
+        for key in [key for key in _SERVICE_CACHE if key[2] == creds_id]:
+            del _SERVICE_CACHE[key]
+
+
+def build_service(api: str, version: str, creds: Any) -> Any:
+    """Return the API client for these credentials, building it once."""
+    key = (api, version, id(creds))
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        from googleapiclient.discovery import build
+        # Use the discovery document bundled with googleapiclient
+        # instead of fetching it over HTTP on every build
+        service = build(
+            api, version, credentials=creds,
+            static_discovery=True, cache_discovery=False,
+            model=response_model()
+        )
+        _SERVICE_CACHE[key] = service
+    return service
+
+
+class ThreadHttp:
+    """
+    Authorized transports for one set of credentials, one per worker thread.
+    
+    httplib2 is not thread-safe, so each worker thread gets its own, and
+    keeps it for the adapter's lifetime so its connection stays alive
+    between calls.
+    """
+    
+    def __init__(self, creds: Any):
+        self._creds = creds
+        self._local = threading.local()
+    
+    def get(self):
+        """Transport for the calling thread; only call this from inside the worker thread."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            http = self._local.http = AuthorizedHttp(self._creds, http=httplib2.Http())
+        return http
+    
+    def execute(self, request):
+        """Execute a request or batch on the calling thread's transport."""
+        return request.execute(http=self.get())
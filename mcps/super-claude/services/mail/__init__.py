@@ -1,5 +1,7 @@
 """Mail Service - Email abstraction."""
 
+import importlib
+
 from .interface import (
     MailAdapter,
     MailAccount,
@@ -11,8 +13,23 @@ from .interface import (
     UploadedAttachment,
     MessageFlag,
 )
-from .manager import MailManager
-from .adapters.gmail import GmailAdapter
+
+# Manager and adapters are resolved lazily (PEP 562) so importing the package
+# for its type definitions does not pull in the Gmail adapter stack.
+_LAZY = {
+    "MailManager": ".manager",
+    "GmailAdapter": ".adapters.gmail",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "MailAdapter",
@@ -4,18 +4,22 @@ Gmail Mail Adapter
 Implements MailAdapter interface for Gmail API.
 """
 
+import asyncio
 import base64
 import mimetypes
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from collections import OrderedDict, deque
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from email.utils import getaddresses, parseaddr
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timezone
 import logging
 import os
+import tempfile
+import time
 
+from ...googleapi import ThreadHttp, build_service, load_credentials
 from ..interface import (
     MailAdapter, MailAccount, Message, MessagePage, Folder,
     Address, Attachment, UploadedAttachment, MessageFlag
@@ -25,6 +29,53 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TOKEN_PATH = Path("/data/config/gmail_token.json")
 
+# Headers requested for thread views
+METADATA_HEADERS = ['From', 'To', 'Cc', 'Subject', 'Date']
+# Listings only render sender and subject; dates come from internalDate
+LIST_HEADERS = ['From', 'Subject']
+# Headers needed to address and thread a reply
+REPLY_HEADERS = ['From', 'To', 'Cc', 'Subject', 'Message-ID', 'References']
+
+# Partial-response field masks, one per call shape
+LIST_FIELDS = 'id,threadId,snippet,labelIds,internalDate,payload/headers'
+FULL_FIELDS = 'id,threadId,snippet,labelIds,internalDate,payload'
+THREAD_FIELDS = f'messages({LIST_FIELDS})'
+MESSAGE_LIST_FIELDS = 'messages/id,nextPageToken,resultSizeEstimate'
+LABEL_LIST_FIELDS = 'labels(id,name)'
+LABEL_GET_FIELDS = 'id,messagesTotal,messagesUnread'
+PROFILE_FIELDS = 'emailAddress'
+ATTACHMENT_FIELDS = 'data'
+
+# Gmail accepts at most 100 sub-requests per batch HTTP call
+BATCH_SIZE = 100
+BATCH_MAX_RETRIES = 3
+# Concurrent batch requests in flight; Gmail rejects bursts with 429
+BATCH_CONCURRENCY = 5
+
+# batchModify / batchDelete accept at most 1000 ids per call
+BATCH_MODIFY_SIZE = 1000
+
+# How long single modify calls wait for company before being flushed (seconds)
+MODIFY_COALESCE_WINDOW = 0.05
+
+# Full messages kept in memory, and for how long (seconds)
+MESSAGE_CACHE_SIZE = 1000
+MESSAGE_CACHE_TTL = 60
+
+# Base64 characters decoded per write when saving attachments (multiple of 4)
+ATTACHMENT_DECODE_CHUNK = 1024 * 1024
+
+# Gmail system labels that map onto message flags; READ is implied by no UNREAD
+_LABEL_TO_FLAG = {
+    'UNREAD': MessageFlag.UNREAD,
+    'STARRED': MessageFlag.STARRED,
+    'IMPORTANT': MessageFlag.IMPORTANT,
+    'DRAFT': MessageFlag.DRAFT,
+    'SENT': MessageFlag.SENT,
+    'TRASH': MessageFlag.TRASH,
+    'SPAM': MessageFlag.SPAM,
+}
+
 
 class GmailAdapter(MailAdapter):
     """Gmail mail adapter."""
@@ -34,8 +85,12 @@ class GmailAdapter(MailAdapter):
     def __init__(self, account: MailAccount):
         super().__init__(account)
         self._service = None
+        self._http: Optional[ThreadHttp] = None
         self._user_email = None
         self._pending_attachments: Dict[str, dict] = {}  # id -> {path, filename, mime_type}
+        self._msg_cache: "OrderedDict[str, Tuple[float, Message]]" = OrderedDict()
+        self._modify_queue: Optional[asyncio.Queue] = None
+        self._modify_task: Optional[asyncio.Task] = None
         
         # Get token path from account config, with fallback to default
         self._token_path = Path(account.config.get("token_path", str(DEFAULT_TOKEN_PATH)))
@@ -43,31 +98,16 @@ class GmailAdapter(MailAdapter):
     async def connect(self) -> bool:
         """Connect to Gmail API."""
         try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from googleapiclient.discovery import build
-            
-            creds = None
-            
-            if self._token_path.exists():
-                try:
-                    creds = Credentials.from_authorized_user_file(str(self._token_path))
-                except Exception as e:
-                    logger.warning(f"Failed to load token file: {e}")
-            
+            creds = await load_credentials(self._token_path)
             if not creds:
                 logger.error(f"No credentials available at {self._token_path}. Complete OAuth flow first.")
                 return False
             
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                with open(self._token_path, 'w') as f:
-                    f.write(creds.to_json())
-            
-            self._service = build('gmail', 'v1', credentials=creds)
+            self._http = ThreadHttp(creds)
+            self._service = build_service('gmail', 'v1', creds)
             
             # Get user email
-            profile = self._service.users().getProfile(userId='me').execute()
+            profile = self._service.users().getProfile(userId='me', fields=PROFILE_FIELDS).execute()
             self._user_email = profile['emailAddress']
             
             logger.info(f"✅ Connected to Gmail: {self._user_email}")
@@ -81,147 +121,246 @@ class GmailAdapter(MailAdapter):
             return False
     
     async def disconnect(self) -> None:
-        """Disconnect from Gmail."""
+        """Disconnect from Gmail, failing any queued label changes."""
+        if self._modify_task is not None:
+            task, self._modify_task = self._modify_task, None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         self._service = None
+        self._http = None
         self._user_email = None
     
+    async def noop(self) -> bool:
+        """Check the connection with a minimal getProfile call."""
+        if not self._service:
+            return False
+        try:
+            await asyncio.to_thread(
+                self._run_request,
+                self._service.users().getProfile(userId='me', fields=PROFILE_FIELDS)
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Gmail liveness check failed: {e}")
+            return False
+    
+    def _run_request(self, request):
+        """Execute a request or batch on this worker thread's transport."""
+        return self._http.execute(request)
+    
     def _parse_address(self, addr_str: str) -> Address:
         """Parse email address string into Address object."""
-        if '<' in addr_str and '>' in addr_str:
-            name = addr_str.split('<')[0].strip().strip('"')
-            email = addr_str.split('<')[1].split('>')[0].strip()
-            return Address(email=email, name=name if name else None)
-        return Address(email=addr_str.strip())
-    
-    def _parse_message(self, msg_data: dict, include_body: bool = False) -> Message:
-        """Parse Gmail API message into Message object."""
-        headers = {}
-        if 'payload' in msg_data and 'headers' in msg_data['payload']:
-            for h in msg_data['payload']['headers']:
-                headers[h['name']] = h['value']
-        
-        # Parse sender
-        sender_str = headers.get('From', '')
-        sender = self._parse_address(sender_str) if sender_str else Address(email='unknown')
-        
-        # Parse recipients
-        to_str = headers.get('To', '')
-        recipients = [self._parse_address(a.strip()) for a in to_str.split(',') if a.strip()]
-        
-        # Parse CC
-        cc_str = headers.get('Cc', '')
-        cc = [self._parse_address(a.strip()) for a in cc_str.split(',') if a.strip()] if cc_str else []
-        
-        # Parse date
-        date = None
-        if 'internalDate' in msg_data:
-            timestamp = int(msg_data['internalDate']) / 1000
-            date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        
-        # Parse flags from labels
+        name, email = parseaddr(addr_str)
+        return Address(email=email or addr_str.strip(), name=name or None)
+    
+    def _parse_address_list(self, header: str) -> List[Address]:
+        """Parse a To/Cc style header, honouring quoted commas in display names."""
+        if not header:
+            return []
+        return [Address(email=email, name=name or None) for name, email in getaddresses([header]) if email]
+    
+    def _parse_meta(
+        self,
+        msg_data: dict,
+        _fromts=datetime.fromtimestamp,
+        _UTC=timezone.utc,
+        _FLAGS=_LABEL_TO_FLAG,
+        _UNREAD=MessageFlag.UNREAD,
+        _READ=MessageFlag.READ
+    ) -> Message:
+        """
+        Parse a format='metadata' message, as fetched for listings.
+        
+        Specialised for that mode: no body or attachment branches, and the
+        trailing defaults bind hot globals as locals (never pass them).
+        Message is built positionally, in field order.
+        """
+        headers = {h['name']: h['value'] for h in (msg_data.get('payload') or {}).get('headers', ())}
+        sender_str = headers.get('From')
         labels = msg_data.get('labelIds', [])
-        flags = []
-        if 'UNREAD' in labels:
-            flags.append(MessageFlag.UNREAD)
-        else:
-            flags.append(MessageFlag.READ)
-        if 'STARRED' in labels:
-            flags.append(MessageFlag.STARRED)
-        if 'IMPORTANT' in labels:
-            flags.append(MessageFlag.IMPORTANT)
-        if 'DRAFT' in labels:
-            flags.append(MessageFlag.DRAFT)
-        if 'SENT' in labels:
-            flags.append(MessageFlag.SENT)
-        if 'TRASH' in labels:
-            flags.append(MessageFlag.TRASH)
-        if 'SPAM' in labels:
-            flags.append(MessageFlag.SPAM)
-        
-        # Parse attachments
-        attachments = []
-        if 'payload' in msg_data:
-            self._extract_attachments(msg_data['payload'], attachments)
-        
-        # Parse body if requested
-        body_text = None
-        body_html = None
-        if include_body and 'payload' in msg_data:
-            body_text, body_html = self._extract_body(msg_data['payload'])
+        # Label IDs are unique, so the sum is a bitwise OR
+        flags = MessageFlag(sum(_FLAGS[label] for label in labels if label in _FLAGS))
+        if not flags & _UNREAD:
+            flags |= _READ
         
         return Message(
-            id=msg_data['id'],
-            thread_id=msg_data.get('threadId'),
-            subject=headers.get('Subject', '(no subject)'),
-            sender=sender,
-            recipients=recipients,
-            cc=cc,
-            date=date,
-            snippet=msg_data.get('snippet', ''),
-            body_text=body_text,
-            body_html=body_html,
-            flags=flags,
-            labels=labels,
-            attachments=attachments,
-            headers=headers
+            msg_data['id'],
+            msg_data.get('threadId'),
+            headers.get('Subject', '(no subject)'),
+            self._parse_address(sender_str) if sender_str else Address(email='unknown'),
+            self._parse_address_list(headers.get('To', '')),
+            self._parse_address_list(headers.get('Cc', '')),
+            [],
+            _fromts(int(msg_data['internalDate']) / 1000, _UTC) if 'internalDate' in msg_data else None,
+            msg_data.get('snippet', ''),
+            None,
+            None,
+            flags,
+            labels,
+            [],
+            headers,
         )
     
+    def _parse_full(self, msg_data: dict) -> Message:
+        """
+        Parse a format='full' message: _parse_meta plus body and attachments.
+        
+        Never decode attachment data here just to measure it; see _extract_attachments.
+        """
+        message = self._parse_meta(msg_data)
+        payload = msg_data.get('payload')
+        if payload:
+            self._extract_attachments(payload, message.attachments)
+            message.body_text, message.body_html = self._extract_body(payload)
+        return message
+    
     def _extract_attachments(self, payload: dict, attachments: list):
-        """Extract attachment metadata from payload."""
-        if 'parts' in payload:
-            for part in payload['parts']:
-                self._extract_attachments(part, attachments)
-        
-        filename = payload.get('filename')
-        if filename and payload.get('body', {}).get('attachmentId'):
-            attachments.append(Attachment(
-                id=payload['body']['attachmentId'],
-                filename=filename,
-                mime_type=payload.get('mimeType', 'application/octet-stream'),
-                size=payload.get('body', {}).get('size', 0)
-            ))
+        """
+        Extract attachment metadata from payload.
+        
+        Sizes come from Gmail's decoded 'size' field, or are estimated from
+        the encoded length; attachment bodies are only decoded on download.
+        """
+        stack = deque([payload])
+        while stack:
+            part = stack.pop()
+            body = part.get('body', {})
+            filename = part.get('filename')
+            if filename and body.get('attachmentId'):
+                attachments.append(Attachment(
+                    id=body['attachmentId'],
+                    filename=filename,
+                    mime_type=part.get('mimeType', 'application/octet-stream'),
+                    size=body.get('size') or len(body.get('data', '')) * 3 // 4
+                ))
+            # Reversed so parts are visited in document order
+            stack.extend(reversed(part.get('parts', ())))
     
-    def _extract_body(self, payload: dict) -> tuple:
-        """Extract text and HTML body from payload."""
+    def _extract_body(self, payload: dict, include_html: bool = True) -> tuple:
+        """
+        Extract text and HTML body from payload.
+        
+        Walks the MIME tree iteratively and stops once every wanted body
+        has been found. With include_html=False the HTML part is never decoded.
+        """
         text_body = None
         html_body = None
+        stack = deque([payload])
         
-        def extract_parts(part):
-            nonlocal text_body, html_body
-            
+        while stack:
+            part = stack.pop()
             mime_type = part.get('mimeType', '')
             
             if mime_type == 'text/plain' and not text_body:
                 data = part.get('body', {}).get('data')
                 if data:
                     text_body = base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
-            elif mime_type == 'text/html' and not html_body:
+            elif include_html and mime_type == 'text/html' and not html_body:
                 data = part.get('body', {}).get('data')
                 if data:
                     html_body = base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
             
-            if 'parts' in part:
-                for p in part['parts']:
-                    extract_parts(p)
+            if text_body and (html_body or not include_html):
+                break
+            stack.extend(reversed(part.get('parts', ())))
         
-        extract_parts(payload)
         return text_body, html_body
     
+    async def _batch_get_messages(self, message_ids: List[str], **get_kwargs) -> List[dict]:
+        """Fetch messages through the Gmail batch endpoint, preserving input order."""
+        get = self._service.users().messages().get
+        return await self._batch_fetch(
+            message_ids, lambda msg_id: get(userId='me', id=msg_id, **get_kwargs)
+        )
+    
+    async def _batch_fetch(self, ids: List[str], make_request) -> List[dict]:
+        """
+        Execute make_request(id) for every id via batch HTTP, preserving input order.
+        
+        Chunks of up to BATCH_SIZE ids run concurrently in worker threads,
+        at most BATCH_CONCURRENCY at a time. If a batch cannot be created the
+        chunk falls back to individual requests. Sub-requests rejected with 429
+        are retried on their own with exponential backoff; other failures
+        are logged and skipped.
+        """
+        results: Dict[str, dict] = {}
+        pending = list(ids)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        delay = 1.0
+        
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            throttled: List[str] = []
+            
+            def callback(request_id, response, exception):
+                if exception is None:
+                    results[request_id] = response
+                elif getattr(getattr(exception, 'resp', None), 'status', None) == 429:
+                    throttled.append(request_id)
+                else:
+                    logger.warning(f"Batch sub-request {request_id} failed: {exception}")
+            
+            async def fetch_one(item_id):
+                try:
+                    request = make_request(item_id)
+                    response = await asyncio.to_thread(self._run_request, request)
+                except Exception as e:
+                    callback(item_id, None, e)
+                else:
+                    callback(item_id, response, None)
+            
+            async def fetch_chunk(chunk):
+                async with semaphore:
+                    try:
+                        batch = self._service.new_batch_http_request(callback=callback)
+                    except Exception as e:
+                        logger.warning(f"Batch request unavailable, fetching individually: {e}")
+                        await asyncio.gather(*(fetch_one(item_id) for item_id in chunk))
+                        return
+                    for item_id in chunk:
+                        batch.add(make_request(item_id), request_id=item_id)
+                    await asyncio.to_thread(self._run_request, batch)
+            
+            await asyncio.gather(*(
+                fetch_chunk(pending[start:start + BATCH_SIZE])
+                for start in range(0, len(pending), BATCH_SIZE)
+            ))
+            
+            if not throttled:
+                break
+            if attempt == BATCH_MAX_RETRIES:
+                logger.warning(f"Giving up on {len(throttled)} rate-limited requests")
+                break
+            await asyncio.sleep(delay)
+            delay *= 2
+            pending = throttled
+        
+        return [results[i] for i in ids if i in results]
+    
     async def list_folders(self) -> List[Folder]:
         """List all Gmail labels as folders."""
         if not self._service:
             return []
         
         try:
-            results = self._service.users().labels().list(userId='me').execute()
+            results = self._service.users().labels().list(userId='me', fields=LABEL_LIST_FIELDS).execute()
             labels = results.get('labels', [])
             
+            # Fetch full label info (for counts) in one batch instead of per label
+            get = self._service.users().labels().get
+            label_infos = {
+                info['id']: info
+                for info in await self._batch_fetch(
+                    [label['id'] for label in labels],
+                    lambda label_id: get(userId='me', id=label_id, fields=LABEL_GET_FIELDS)
+                )
+            }
+            
             folders = []
             for label in labels:
-                # Get full label info for counts
-                label_info = self._service.users().labels().get(
-                    userId='me', id=label['id']
-                ).execute()
+                label_info = label_infos.get(label['id'], {})
                 
                 folder_type = None
                 if label['id'] == 'INBOX':
@@ -269,22 +408,22 @@ class GmailAdapter(MailAdapter):
             params = {
                 'userId': 'me',
                 'q': query,
-                'maxResults': min(limit, 100)
+                'maxResults': min(limit, 100),
+                'fields': MESSAGE_LIST_FIELDS
             }
             if cursor:
                 params['pageToken'] = cursor
             
             results = self._service.users().messages().list(**params).execute()
             
-            messages = []
-            for msg_ref in results.get('messages', []):
-                msg_data = self._service.users().messages().get(
-                    userId='me',
-                    id=msg_ref['id'],
-                    format='metadata',
-                    metadataHeaders=['From', 'To', 'Cc', 'Subject', 'Date']
-                ).execute()
-                messages.append(self._parse_message(msg_data))
+            ids = [m['id'] for m in results.get('messages', ())]
+            parse = self._parse_meta
+            messages = [
+                parse(msg_data)
+                for msg_data in await self._batch_get_messages(
+                    ids, format='metadata', metadataHeaders=LIST_HEADERS, fields=LIST_FIELDS
+                )
+            ]
             
             return MessagePage(
                 messages=messages,
@@ -296,18 +435,63 @@ class GmailAdapter(MailAdapter):
             logger.error(f"Failed to list messages: {e}")
             return MessagePage(messages=[])
     
+    def _cached_message(self, message_id: str) -> Optional[Message]:
+        """Return a fresh cached full message, dropping it if expired."""
+        entry = self._msg_cache.get(message_id)
+        if entry is None:
+            return None
+        stored_at, message = entry
+        if time.monotonic() - stored_at > MESSAGE_CACHE_TTL:
+            del self._msg_cache[message_id]
+            return None
+        self._msg_cache.move_to_end(message_id)
+        return message
+    
+    def _cache_message(self, message: Message) -> None:
+        """Store a full message, evicting the least recently used past the limit."""
+        cache = self._msg_cache
+        cache[message.id] = (time.monotonic(), message)
+        cache.move_to_end(message.id)
+        while len(cache) > MESSAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    async def _fetch_full_message(self, message_id: str) -> Message:
+        """Fetch and parse a message with format='full'."""
+        msg_data = self._service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='full',
+            fields=FULL_FIELDS
+        ).execute()
+        return self._parse_full(msg_data)
+    
+    async def _get_headers(self, message_id: str) -> Message:
+        """Fetch only the headers needed to reply (format='metadata', no body)."""
+        cached = self._cached_message(message_id)
+        if cached is not None:
+            return cached
+        msg_data = self._service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='metadata',
+            metadataHeaders=REPLY_HEADERS,
+            fields=LIST_FIELDS
+        ).execute()
+        return self._parse_meta(msg_data)
+    
     async def get_message(self, message_id: str) -> Optional[Message]:
         """Get full message including body."""
         if not self._service:
             return None
         
+        cached = self._cached_message(message_id)
+        if cached is not None:
+            return cached
+        
         try:
-            msg_data = self._service.users().messages().get(
-                userId='me',
-                id=message_id,
-                format='full'
-            ).execute()
-            return self._parse_message(msg_data, include_body=True)
+            message = await self._fetch_full_message(message_id)
+            self._cache_message(message)
+            return message
             
         except Exception as e:
             logger.error(f"Failed to get message: {e}")
@@ -323,12 +507,15 @@ class GmailAdapter(MailAdapter):
                 userId='me',
                 id=thread_id,
                 format='metadata',
-                metadataHeaders=['From', 'To', 'Cc', 'Subject', 'Date']
+                metadataHeaders=METADATA_HEADERS,
+                fields=THREAD_FIELDS
             ).execute()
             
-            messages = []
-            for msg_data in thread.get('messages', []):
-                messages.append(self._parse_message(msg_data))
+            parse = self._parse_meta
+            messages = [
+                parse(msg_data)
+                for msg_data in thread.get('messages', ())
+            ]
             
             # Sort by date
             messages.sort(key=lambda m: m.date or datetime.min.replace(tzinfo=timezone.utc))
@@ -357,22 +544,22 @@ class GmailAdapter(MailAdapter):
             params = {
                 'userId': 'me',
                 'q': full_query,
-                'maxResults': min(limit, 100)
+                'maxResults': min(limit, 100),
+                'fields': MESSAGE_LIST_FIELDS
             }
             if cursor:
                 params['pageToken'] = cursor
             
             results = self._service.users().messages().list(**params).execute()
             
-            messages = []
-            for msg_ref in results.get('messages', []):
-                msg_data = self._service.users().messages().get(
-                    userId='me',
-                    id=msg_ref['id'],
-                    format='metadata',
-                    metadataHeaders=['From', 'To', 'Cc', 'Subject', 'Date']
-                ).execute()
-                messages.append(self._parse_message(msg_data))
+            ids = [m['id'] for m in results.get('messages', ())]
+            parse = self._parse_meta
+            messages = [
+                parse(msg_data)
+                for msg_data in await self._batch_get_messages(
+                    ids, format='metadata', metadataHeaders=LIST_HEADERS, fields=LIST_FIELDS
+                )
+            ]
             
             return MessagePage(
                 messages=messages,
@@ -431,14 +618,27 @@ class GmailAdapter(MailAdapter):
             attachment = self._service.users().messages().attachments().get(
                 userId='me',
                 messageId=message_id,
-                id=attachment_id
+                id=attachment_id,
+                fields=ATTACHMENT_FIELDS
             ).execute()
             
-            data = base64.urlsafe_b64decode(attachment['data'])
+            # Decode in slices so only one chunk of decoded bytes is alive at a time
+            data = attachment['data']
             
             path = Path(local_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(data)
+            # Raw fd: each decoded chunk goes to the kernel in one write(2)
+            # without passing through a userspace file buffer
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(path, flags, 0o644)
+            try:
+                for start in range(0, len(data), ATTACHMENT_DECODE_CHUNK):
+                    chunk = data[start:start + ATTACHMENT_DECODE_CHUNK]
+                    view = memoryview(base64.urlsafe_b64decode(chunk + '=' * (-len(chunk) % 4)))
+                    while view:
+                        view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             return f"✅ Downloaded attachment to: {local_path}"
             
@@ -455,18 +655,13 @@ class GmailAdapter(MailAdapter):
         html: bool = False,
         attachment_ids: Optional[List[str]] = None,
         reply_to: Optional[Message] = None
-    ) -> dict:
-        """Create a message for the Gmail API."""
-        if attachment_ids and any(aid in self._pending_attachments for aid in attachment_ids):
-            msg = MIMEMultipart()
-        else:
-            msg = MIMEMultipart() if html else None
-            if not msg:
-                msg = MIMEText(body, 'plain')
-        
+    ) -> EmailMessage:
+        """Create a MIME message for the Gmail API."""
+        msg = EmailMessage()
         msg['To'] = ', '.join(to)
         msg['Subject'] = subject
-        msg['From'] = self._user_email
+        if self._user_email:
+            msg['From'] = self._user_email
         
         if cc:
             msg['Cc'] = ', '.join(cc)
@@ -477,27 +672,51 @@ class GmailAdapter(MailAdapter):
         if reply_to:
             if reply_to.headers.get('Message-ID'):
                 msg['In-Reply-To'] = reply_to.headers['Message-ID']
-                msg['References'] = reply_to.headers.get('References', '') + ' ' + reply_to.headers['Message-ID']
+                msg['References'] = f"{reply_to.headers.get('References', '')} {reply_to.headers['Message-ID']}".strip()
         
-        # Add body
-        if isinstance(msg, MIMEMultipart):
-            content_type = 'html' if html else 'plain'
-            msg.attach(MIMEText(body, content_type))
+        # Add body; becomes multipart/mixed once an attachment is added
+        msg.set_content(body, subtype='html' if html else 'plain')
         
         # Add attachments
         if attachment_ids:
             for att_id in attachment_ids:
                 if att_id in self._pending_attachments:
                     att_info = self._pending_attachments[att_id]
+                    maintype, subtype = att_info['mime_type'].split('/', 1)
                     with open(att_info['path'], 'rb') as f:
-                        part = MIMEBase(*att_info['mime_type'].split('/'))
-                        part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header('Content-Disposition', f'attachment; filename="{att_info["filename"]}"')
-                    msg.attach(part)
+                        msg.add_attachment(
+                            f.read(), maintype=maintype, subtype=subtype,
+                            filename=att_info['filename']
+                        )
+        
+        return msg
+    
+    def _send_message(self, msg: EmailMessage, thread_id: Optional[str] = None) -> dict:
+        """
+        Send a MIME message, returning the Gmail API response.
+        
+        Single-part messages go inline as base64 'raw'. Messages with
+        attachments are written to a temp file and sent through the media
+        upload endpoint, so no second base64 copy of the message is held in memory.
+        """
+        body = {'threadId': thread_id} if thread_id else {}
+        send = self._service.users().messages().send
         
-        raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
-        return {'raw': raw}
+        if not msg.is_multipart():
+            body['raw'] = base64.urlsafe_b64encode(bytes(msg)).decode('ascii')
+            return send(userId='me', body=body).execute()
+        
+        from googleapiclient.http import MediaFileUpload
+        
+        with tempfile.NamedTemporaryFile(suffix='.eml') as tmp:
+            BytesGenerator(tmp).flatten(msg)
+            tmp.flush()
+            media = MediaFileUpload(tmp.name, mimetype='message/rfc822', resumable=True)
+            request = send(userId='me', body=body, media_body=media)
+            response = None
+            while response is None:
+                _, response = request.next_chunk()
+        return response
     
     async def send(
         self,
@@ -515,7 +734,7 @@ class GmailAdapter(MailAdapter):
         
         try:
             message = self._create_message(to, subject, body, cc, bcc, html, attachment_ids)
-            result = self._service.users().messages().send(userId='me', body=message).execute()
+            result = self._send_message(message)
             
             # Clean up used attachments
             if attachment_ids:
@@ -540,8 +759,8 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
-            # Get original message
-            original = await self.get_message(message_id)
+            # Get original message headers; the body isn't needed to reply
+            original = await self._get_headers(message_id)
             if not original:
                 return f"❌ Original message not found: {message_id}"
             
@@ -560,9 +779,7 @@ class GmailAdapter(MailAdapter):
                 subject = f"Re: {subject}"
             
             message = self._create_message(to, subject, body, cc, None, html, attachment_ids, original)
-            message['threadId'] = original.thread_id
-            
-            result = self._service.users().messages().send(userId='me', body=message).execute()
+            result = self._send_message(message, original.thread_id)
             
             if attachment_ids:
                 for att_id in attachment_ids:
@@ -585,18 +802,24 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
-            original = await self.get_message(message_id)
+            original = (
+                self._cached_message(message_id)
+                or await self._fetch_full_message(message_id)
+            )
             if not original:
                 return f"❌ Original message not found: {message_id}"
             
             # Build forward body
-            forward_body = body or ""
-            forward_body += f"\n\n---------- Forwarded message ----------\n"
-            forward_body += f"From: {original.sender}\n"
-            forward_body += f"Date: {original.date}\n"
-            forward_body += f"Subject: {original.subject}\n"
-            forward_body += f"To: {', '.join(str(r) for r in original.recipients)}\n\n"
-            forward_body += original.body_text or original.body_html or ""
+            recipients = ', '.join(map(str, original.recipients))
+            forward_body = "".join((
+                body or "",
+                "\n\n---------- Forwarded message ----------\n",
+                f"From: {original.sender}\n",
+                f"Date: {original.date}\n",
+                f"Subject: {original.subject}\n",
+                f"To: {recipients}\n\n",
+                original.body_text or original.body_html or "",
+            ))
             
             subject = original.subject
             if not subject.lower().startswith('fwd:'):
@@ -606,7 +829,7 @@ class GmailAdapter(MailAdapter):
             # Note: For a full implementation, we'd need to download and re-attach
             
             message = self._create_message(to, subject, forward_body, None, None, False, attachment_ids)
-            result = self._service.users().messages().send(userId='me', body=message).execute()
+            result = self._send_message(message)
             
             return f"✅ Forwarded message: {result['id']}"
             
@@ -619,11 +842,8 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
-            self._service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={'addLabelIds': [folder]}
-            ).execute()
+            self._msg_cache.pop(message_id, None)
+            await self._queue_op(message_id, ('modify', (folder,), ()))
             return f"✅ Moved message to: {folder}"
             
         except Exception as e:
@@ -635,11 +855,12 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
+            self._msg_cache.pop(message_id, None)
             if permanent:
-                self._service.users().messages().delete(userId='me', id=message_id).execute()
+                await self._queue_op(message_id, ('delete',))
                 return f"✅ Permanently deleted message"
             else:
-                self._service.users().messages().trash(userId='me', id=message_id).execute()
+                await self._queue_op(message_id, ('trash',))
                 return f"✅ Moved message to trash"
             
         except Exception as e:
@@ -651,16 +872,13 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
+            self._msg_cache.pop(message_id, None)
             if read:
-                body = {'removeLabelIds': ['UNREAD']}
+                op = ('modify', (), ('UNREAD',))
             else:
-                body = {'addLabelIds': ['UNREAD']}
+                op = ('modify', ('UNREAD',), ())
             
-            self._service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body=body
-            ).execute()
+            await self._queue_op(message_id, op)
             return f"✅ Marked message as {'read' if read else 'unread'}"
             
         except Exception as e:
@@ -672,17 +890,230 @@ class GmailAdapter(MailAdapter):
             return "❌ Not connected to Gmail"
         
         try:
+            self._msg_cache.pop(message_id, None)
             if flagged:
-                body = {'addLabelIds': ['STARRED']}
+                op = ('modify', ('STARRED',), ())
             else:
-                body = {'removeLabelIds': ['STARRED']}
+                op = ('modify', (), ('STARRED',))
             
-            self._service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body=body
-            ).execute()
+            await self._queue_op(message_id, op)
             return f"✅ {'Starred' if flagged else 'Unstarred'} message"
             
         except Exception as e:
             return f"❌ Mark flagged failed: {e}"
+    
+    # Bulk operations
+    
+    @staticmethod
+    def _label_body(add: Optional[List[str]], remove: Optional[List[str]]) -> dict:
+        """Build a modify request body for the given label changes."""
+        body = {}
+        if add:
+            body['addLabelIds'] = list(add)
+        if remove:
+            body['removeLabelIds'] = list(remove)
+        return body
+    
+    async def _batch_modify(
+        self,
+        message_ids: List[str],
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None
+    ) -> None:
+        """Apply one label change to many messages with messages.batchModify."""
+        body = self._label_body(add, remove)
+        
+        batch_modify = self._service.users().messages().batchModify
+        for start in range(0, len(message_ids), BATCH_MODIFY_SIZE):
+            ids = message_ids[start:start + BATCH_MODIFY_SIZE]
+            await asyncio.to_thread(
+                self._run_request, batch_modify(userId='me', body={**body, 'ids': ids})
+            )
+        
+        for message_id in message_ids:
+            self._msg_cache.pop(message_id, None)
+    
+    async def _batch_delete(self, message_ids: List[str]) -> None:
+        """Permanently delete many messages with messages.batchDelete."""
+        batch_delete = self._service.users().messages().batchDelete
+        for start in range(0, len(message_ids), BATCH_MODIFY_SIZE):
+            ids = message_ids[start:start + BATCH_MODIFY_SIZE]
+            await asyncio.to_thread(
+                self._run_request, batch_delete(userId='me', body={'ids': ids})
+            )
+    
+    async def _batch_trash(self, message_ids: List[str]) -> List[dict]:
+        """Trash many messages; there is no bulk trash call, so send them as a batch."""
+        trash = self._service.users().messages().trash
+        return await self._batch_fetch(
+            message_ids, lambda message_id: trash(userId='me', id=message_id)
+        )
+    
+    async def _queue_op(self, message_id: str, op: tuple) -> None:
+        """
+        Queue a single-message operation and wait until its batch is applied.
+        
+        op is ('modify', add_labels, remove_labels), ('delete',) or ('trash',).
+        Concurrent callers are coalesced by _modify_worker into bulk calls.
+        """
+        if self._modify_task is None or self._modify_task.done():
+            self._modify_queue = asyncio.Queue()
+            self._modify_task = asyncio.get_running_loop().create_task(self._modify_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._modify_queue.put((message_id, op, future))
+        await future
+    
+    async def _modify_worker(self) -> None:
+        """
+        Drain queued operations, group identical ones and apply each group in bulk.
+        
+        When the worker stops (on disconnect), every operation still queued
+        or in flight fails with ConnectionError so no caller waits forever.
+        """
+        queue = self._modify_queue
+        items: list = []
+        try:
+            await self._drain_modify_queue(queue, items)
+        finally:
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            error = ConnectionError("Gmail adapter disconnected")
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(error)
+    
+    async def _drain_modify_queue(self, queue: asyncio.Queue, items: list) -> None:
+        """Worker loop for _modify_worker; items holds the operations in flight."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            items[:] = [await queue.get()]
+            deadline = loop.time() + MODIFY_COALESCE_WINDOW
+            while len(items) < BATCH_MODIFY_SIZE:
+                try:
+                    items.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            groups: Dict[tuple, list] = {}
+            for item in items:
+                groups.setdefault(item[1], []).append(item)
+            
+            for op, group in groups.items():
+                ids = [message_id for message_id, _, _ in group]
+                failed = set()
+                try:
+                    if op[0] == 'modify':
+                        await self._batch_modify(ids, add=op[1], remove=op[2])
+                    elif op[0] == 'delete':
+                        await self._batch_delete(ids)
+                    else:
+                        trashed = {msg['id'] for msg in await self._batch_trash(ids)}
+                        failed = set(ids) - trashed
+                except Exception as e:
+                    # One bad id fails the whole bulk call; retry each message
+                    # alone so every caller gets its own result
+                    logger.warning(f"Bulk {op[0]} of {len(ids)} messages failed, retrying individually: {e}")
+                    await self._apply_each(op, group)
+                    continue
+                
+                for message_id, _, future in group:
+                    if future.done():
+                        continue
+                    if message_id in failed:
+                        future.set_exception(RuntimeError(f"Could not trash message {message_id}"))
+                    else:
+                        future.set_result(None)
+    
+    async def _apply_each(self, op: tuple, group: list) -> None:
+        """Apply a queued operation to each message of a group separately, settling its future."""
+        messages = self._service.users().messages()
+        
+        async def apply(message_id, future):
+            if op[0] == 'modify':
+                request = messages.modify(userId='me', id=message_id, body=self._label_body(op[1], op[2]))
+            elif op[0] == 'delete':
+                request = messages.delete(userId='me', id=message_id)
+            else:
+                request = messages.trash(userId='me', id=message_id)
+            try:
+                await asyncio.to_thread(self._run_request, request)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self._msg_cache.pop(message_id, None)
+                if not future.done():
+                    future.set_result(None)
+        
+        await asyncio.gather(*(apply(message_id, future) for message_id, _, future in group))
+    
+    async def mark_read_many(self, message_ids: List[str], read: bool = True) -> str:
+        """Mark many messages as read or unread."""
+        if not self._service:
+            return "❌ Not connected to Gmail"
+        
+        try:
+            if read:
+                await self._batch_modify(message_ids, remove=['UNREAD'])
+            else:
+                await self._batch_modify(message_ids, add=['UNREAD'])
+            return f"✅ Marked {len(message_ids)} messages as {'read' if read else 'unread'}"
+            
+        except Exception as e:
+            return f"❌ Mark read failed: {e}"
+    
+    async def mark_flagged_many(self, message_ids: List[str], flagged: bool = True) -> str:
+        """Star or unstar many messages."""
+        if not self._service:
+            return "❌ Not connected to Gmail"
+        
+        try:
+            if flagged:
+                await self._batch_modify(message_ids, add=['STARRED'])
+            else:
+                await self._batch_modify(message_ids, remove=['STARRED'])
+            return f"✅ {'Starred' if flagged else 'Unstarred'} {len(message_ids)} messages"
+            
+        except Exception as e:
+            return f"❌ Mark flagged failed: {e}"
+    
+    async def move_many(self, message_ids: List[str], folder: str) -> str:
+        """Move many messages to a folder (label)."""
+        if not self._service:
+            return "❌ Not connected to Gmail"
+        
+        try:
+            await self._batch_modify(message_ids, add=[folder])
+            return f"✅ Moved {len(message_ids)} messages to: {folder}"
+            
+        except Exception as e:
+            return f"❌ Move failed: {e}"
+    
+    async def delete_many(self, message_ids: List[str], permanent: bool = False) -> str:
+        """Delete many messages (batchDelete when permanent, batched trash otherwise)."""
+        if not self._service:
+            return "❌ Not connected to Gmail"
+        
+        try:
+            for message_id in message_ids:
+                self._msg_cache.pop(message_id, None)
+            
+            if permanent:
+                await self._batch_delete(message_ids)
+                return f"✅ Permanently deleted {len(message_ids)} messages"
+            
+            trashed = await self._batch_trash(message_ids)
+            return f"✅ Moved {len(trashed)} messages to trash"
+            
+        except Exception as e:
+            return f"❌ Delete failed: {e}"
@@ -9,22 +9,22 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import IntFlag
 
 
-class MessageFlag(Enum):
-    """Standard message flags."""
-    READ = "read"
-    UNREAD = "unread"
-    STARRED = "starred"
-    IMPORTANT = "important"
-    DRAFT = "draft"
-    SENT = "sent"
-    TRASH = "trash"
-    SPAM = "spam"
+class MessageFlag(IntFlag):
+    """Standard message flags, combined as a bitmask."""
+    READ = 1
+    UNREAD = 2
+    STARRED = 4
+    IMPORTANT = 8
+    DRAFT = 16
+    SENT = 32
+    TRASH = 64
+    SPAM = 128
 
 
-@dataclass
+@dataclass(slots=True)
 class Address:
     """Email address with optional display name."""
     email: str
@@ -36,7 +36,7 @@ class Address:
         return self.email
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """Email attachment metadata (from received message)."""
     id: str
@@ -45,7 +45,7 @@ class Attachment:
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadedAttachment:
     """Result of uploading an attachment for sending."""
     id: str
@@ -54,7 +54,7 @@ class UploadedAttachment:
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Email message."""
     id: str
@@ -68,13 +68,18 @@ class Message:
     snippet: str = ""
     body_text: Optional[str] = None
     body_html: Optional[str] = None
-    flags: List[MessageFlag] = field(default_factory=list)
+    flags: MessageFlag = MessageFlag(0)
     labels: List[str] = field(default_factory=list)
     attachments: List[Attachment] = field(default_factory=list)
     headers: Dict[str, str] = field(default_factory=dict)
+    
+    @property
+    def flags_set(self) -> List[MessageFlag]:
+        """The individual flags that are set, for callers that want a list."""
+        return [flag for flag in MessageFlag if flag & self.flags]
 
 
-@dataclass 
+@dataclass(slots=True)
 class Folder:
     """Mailbox folder."""
     id: str
@@ -85,7 +90,7 @@ class Folder:
     folder_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MessagePage:
     """Paginated message results."""
     messages: List[Message]
@@ -93,7 +98,7 @@ class MessagePage:
     total_estimate: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MailAccount:
     """A named mail account configuration."""
     name: str
@@ -233,3 +238,7 @@ class MailAdapter(ABC):
     async def mark_flagged(self, message_id: str, flagged: bool = True) -> str:
         """Mark message as starred/flagged."""
         pass
+    
+    async def noop(self) -> bool:
+        """Cheap liveness check. Override if the provider has one."""
+        return True
@@ -4,17 +4,29 @@ Mail Account Manager
 Manages named mail accounts and adapter instances.
 """
 
-import json
+import asyncio
+import time
 from pathlib import Path
-from typing import Dict, Optional, Type, List
+from typing import Any, Dict, Optional, Type, List
 import logging
 
+from ..servicejson import read_config, write_config
 from .interface import MailAdapter, MailAccount, Message, MessagePage, Folder
 
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE = Path("/data/config/mail_accounts.json")
 
+# Adapters idle longer than this (seconds) are checked with noop() before
+# reuse; stays under the ~30 minute idle drop some providers apply
+IDLE_CHECK_AFTER = 1500
+
+# Accounts queried at once by the *_all fan-out methods
+FANOUT_CONCURRENCY = 8
+
+# Messages requested per page by the *_full methods
+PAGE_SIZE = 100
+
 
 class MailManager:
     """
@@ -26,6 +38,10 @@ class MailManager:
         self.accounts: Dict[str, MailAccount] = {}
         self.adapters: Dict[str, MailAdapter] = {}
         self.adapter_classes: Dict[str, Type[MailAdapter]] = {}
+        self._last_used: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Last config read or written, to skip no-op saves
+        self._saved: Optional[Dict[str, Any]] = None
         
         self._load_accounts()
     
@@ -36,35 +52,41 @@ class MailManager:
     
     def _load_accounts(self) -> None:
         """Load accounts from config file."""
-        if not self.config_path.exists():
-            logger.info("No mail accounts config found, starting fresh")
-            return
-        
         try:
-            config = json.loads(self.config_path.read_text())
+            config = read_config(self.config_path)
             for name, data in config.get("accounts", {}).items():
                 self.accounts[name] = MailAccount(
                     name=name,
                     adapter=data.get("adapter", ""),
                     credentials_ref=data.get("credentials_ref", ""),
-                    config=data.get("config", {})
+                    config=dict(data.get("config", {}))
                 )
+            self._saved = config
             logger.info(f"✅ Loaded {len(self.accounts)} mail accounts")
+        except FileNotFoundError:
+            logger.info("No mail accounts config found, starting fresh")
         except Exception as e:
             logger.error(f"❌ Failed to load accounts: {e}")
     
     def _save_accounts(self) -> None:
-        """Save accounts to config file."""
+        """
+        Save accounts to config file.
+        
+        Skips the write when nothing changed since the last load or save.
+        """
         config = {"accounts": {}}
         for name, account in self.accounts.items():
             config["accounts"][name] = {
                 "adapter": account.adapter,
                 "credentials_ref": account.credentials_ref,
-                "config": account.config
+                "config": dict(account.config)
             }
         
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        self.config_path.write_text(json.dumps(config, indent=2))
+        if config == self._saved:
+            return
+        
+        write_config(self.config_path, config)
+        self._saved = config
     
     def add_account(
         self,
@@ -98,6 +120,8 @@ class MailManager:
         
         if name in self.adapters:
             del self.adapters[name]
+        self._last_used.pop(name, None)
+        self._locks.pop(name, None)
         
         del self.accounts[name]
         self._save_accounts()
@@ -117,13 +141,36 @@ class MailManager:
         return "\n".join(lines)
     
     async def get_adapter(self, account_name: str) -> Optional[MailAdapter]:
-        """Get or create an adapter instance for an account."""
+        """
+        Get or create an adapter instance for an account.
+        
+        A cached adapter idle for more than IDLE_CHECK_AFTER seconds is
+        checked with noop() first and rebuilt if the check fails.
+        """
         if account_name not in self.accounts:
             logger.error(f"Account not found: {account_name}")
             return None
         
-        if account_name in self.adapters:
-            return self.adapters[account_name]
+        lock = self._locks.setdefault(account_name, asyncio.Lock())
+        async with lock:
+            adapter = await self._connect_adapter(account_name)
+            if adapter is not None:
+                self._last_used[account_name] = time.monotonic()
+            return adapter
+    
+    async def _connect_adapter(self, account_name: str) -> Optional[MailAdapter]:
+        """Return a live adapter for an account, connecting if needed."""
+        adapter = self.adapters.get(account_name)
+        if adapter is not None:
+            idle = time.monotonic() - self._last_used.get(account_name, 0.0)
+            if idle <= IDLE_CHECK_AFTER or await adapter.noop():
+                return adapter
+            logger.info(f"Reconnecting idle mail account: {account_name}")
+            del self.adapters[account_name]
+            try:
+                await adapter.disconnect()
+            except Exception as e:
+                logger.warning(f"Disconnect failed for {account_name}: {e}")
         
         account = self.accounts[account_name]
         
@@ -161,6 +208,103 @@ class MailManager:
             return MessagePage(messages=[])
         return await adapter.list_messages(folder, limit, cursor, unread_only)
     
+    async def _fan_out(self, account_names: List[str], call) -> Dict[str, MessagePage]:
+        """
+        Run call(account_name) for each account concurrently.
+        
+        Results keep the order of account_names. An account that fails is
+        logged and given an empty page, so one provider cannot sink the rest.
+        """
+        semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+        
+        async def run(name):
+            async with semaphore:
+                return await call(name)
+        
+        results = await asyncio.gather(*(run(name) for name in account_names), return_exceptions=True)
+        pages = {}
+        for name, result in zip(account_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Mail fan-out failed for {name}: {result}")
+                result = MessagePage(messages=[])
+            pages[name] = result
+        return pages
+    
+    async def list_messages_all(
+        self,
+        account_names: List[str],
+        folder: str = "INBOX",
+        limit: int = 50,
+        unread_only: bool = False
+    ) -> Dict[str, MessagePage]:
+        """List the first page of a folder across several accounts at once."""
+        return await self._fan_out(
+            account_names,
+            lambda name: self.list_messages(name, folder, limit, None, unread_only)
+        )
+    
+    async def search_all(
+        self,
+        account_names: List[str],
+        query: str,
+        folder: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict[str, MessagePage]:
+        """Run one search across several accounts at once."""
+        return await self._fan_out(
+            account_names,
+            lambda name: self.search(name, query, folder, limit)
+        )
+    
+    async def _collect_pages(self, fetch, limit: int) -> List[Message]:
+        """
+        Gather up to limit messages by calling fetch(cursor, page_limit).
+        
+        Cursors are opaque (e.g. Gmail page tokens), so pages are followed
+        one at a time.
+        """
+        first = await fetch(None, min(PAGE_SIZE, limit))
+        messages = list(first.messages)
+        cursor = first.next_cursor
+        while cursor and len(messages) < limit:
+            page = await fetch(cursor, min(PAGE_SIZE, limit - len(messages)))
+            messages.extend(page.messages)
+            cursor = page.next_cursor
+        
+        return messages[:limit]
+    
+    async def list_messages_full(
+        self,
+        account_name: str,
+        folder: str = "INBOX",
+        limit: int = 500,
+        unread_only: bool = False
+    ) -> List[Message]:
+        """List up to limit messages in a folder, across as many pages as needed."""
+        adapter = await self.get_adapter(account_name)
+        if not adapter:
+            return []
+        return await self._collect_pages(
+            lambda cursor, page_limit: adapter.list_messages(folder, page_limit, cursor, unread_only),
+            limit
+        )
+    
+    async def search_full(
+        self,
+        account_name: str,
+        query: str,
+        folder: Optional[str] = None,
+        limit: int = 500
+    ) -> List[Message]:
+        """Search for up to limit messages, across as many pages as needed."""
+        adapter = await self.get_adapter(account_name)
+        if not adapter:
+            return []
+        return await self._collect_pages(
+            lambda cursor, page_limit: adapter.search(query, folder, page_limit, cursor),
+            limit
+        )
+    
     async def get_message(self, account_name: str, message_id: str) -> Optional[Message]:
         adapter = await self.get_adapter(account_name)
         if not adapter:
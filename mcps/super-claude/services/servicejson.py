@@ -0,0 +1,105 @@
+"""
+Shared JSON helpers for the services.
+
+Account config load/save used by the managers, and the orjson response
+model used by the Google API adapters. orjson is optional; without it
+everything falls back to the stdlib json module.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed config per path, keyed to the file's mtime, shared by all managers
+_CONFIG_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def loads(data: bytes) -> Dict[str, Any]:
+    """Decode config JSON, with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def dumps(config: Dict[str, Any]) -> bytes:
+    """Encode config as indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+
+def read_config(path: Path) -> Dict[str, Any]:
+    """
+    Load a JSON config file.
+    
+    The parsed file is cached per path and reused while its mtime is
+    unchanged, so several managers in one process decode it once. Raises
+    FileNotFoundError when the file does not exist.
+    """
+    mtime = path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    config = loads(path.read_bytes())
+    _CONFIG_CACHE[path] = (mtime, config)
+    return config
+
+
+def write_config(path: Path, config: Dict[str, Any], durable: bool = False) -> None:
+    """
+    Atomically replace a JSON config file.
+    
+    Writes a sibling temp file and swaps it in with os.replace, so readers
+    never see a partial file. With durable, the temp file and then the
+    directory are fsynced so the rename itself survives a crash.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    data = memoryview(dumps(config))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    
+    if durable:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    _CONFIG_CACHE[path] = (path.stat().st_mtime_ns, config)
+
+
+def response_model():
+    """
+    JsonModel that decodes Google API responses with orjson when installed.
+    
+    Returns None (the googleapiclient default model) otherwise. Compression
+    needs no setup: httplib2 already sends Accept-Encoding: gzip.
+    """
+    if orjson is None:
+        return None
+    
+    from googleapiclient.model import JsonModel
+    
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode('utf-8') if isinstance(content, bytes) else content
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+    
+    return OrjsonModel()
@@ -4,26 +4,86 @@ Google Drive Storage Adapter
 Implements StorageAdapter interface for Google Drive.
 """
 
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 import logging
+import os
+import time
 
+from ...googleapi import ThreadHttp, build_service, load_credentials
 from ..interface import StorageAdapter, StorageAccount, FileInfo, FilePage
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TOKEN_PATH = Path("/data/config/gdrive_token.json")
 
+# How long resolved folder IDs (and misses) are trusted, in seconds
+PATH_CACHE_TTL = 300
+
+# Resolved paths (and misses) kept, least recently used evicted first
+PATH_CACHE_SIZE = 4096
+
+# Seconds a successful connect probe is trusted for the same token
+PROBE_INTERVAL = 600
+
+# Folders fetched per page when preloading the folder tree
+FOLDER_PAGE_SIZE = 1000
+
+# Concurrent requests in flight for batch chunks, bulk_get_info and downloads
+BULK_CONCURRENCY = 16
+
+# Sub-requests per batch HTTP request (Drive allows up to 100)
+BATCH_SIZE = 100
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+
+# Transfer chunk size for resumable uploads and downloads
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files smaller than this are sent as a single multipart upload
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+
+def _q_escape(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _split(remote_path: str) -> Tuple[str, str]:
+    """
+    Split a remote path into (name, parent) without building Path objects.
+    
+    A bare name has parent "/", so the parent always resolves directly.
+    """
+    path = remote_path.rstrip("/")
+    i = path.rfind("/")
+    if i < 0:
+        return path, "/"
+    return path[i + 1:], path[:i] or "/"
+
 
 class GDriveAdapter(StorageAdapter):
     """Google Drive storage adapter."""
     
     adapter_type = "gdrive"
     
+    # (account name, access token) -> time of the last successful probe
+    _PROBED: Dict[Tuple[str, Optional[str]], float] = {}
+    
     def __init__(self, account: StorageAccount):
         super().__init__(account)
         self._service = None
+        self._http: Optional[ThreadHttp] = None
+        self._root_id: Optional[str] = None
+        # Normalized folder path -> (folder ID or None for a miss, time cached)
+        self._path_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        # (parent ID, folder name) -> (folder ID, time seen); "root" stands
+        # for the root ID. Entries expire after PATH_CACHE_TTL like the path cache
+        self._folder_tree: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._preload_task: Optional[asyncio.Task] = None
         
         # Get token path from account config, with fallback to default
         self._token_path = Path(account.config.get("token_path", str(DEFAULT_TOKEN_PATH)))
@@ -31,31 +91,26 @@ class GDriveAdapter(StorageAdapter):
     async def connect(self) -> bool:
         """Connect to Google Drive API."""
         try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from googleapiclient.discovery import build
-            
-            creds = None
-            
-            if self._token_path.exists():
-                try:
-                    creds = Credentials.from_authorized_user_file(str(self._token_path))
-                    logger.info("Loaded credentials from token file")
-                except Exception as e:
-                    logger.warning(f"Failed to load token file: {e}")
-            
+            creds = await load_credentials(self._token_path)
             if not creds:
                 logger.error("No credentials available. Complete OAuth flow first.")
                 return False
             
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                with open(self._token_path, 'w') as f:
-                    f.write(creds.to_json())
-                logger.info("Token refreshed and saved")
+            self._http = ThreadHttp(creds)
+            self._service = build_service('drive', 'v3', creds)
             
-            self._service = build('drive', 'v3', credentials=creds)
-            self._service.about().get(fields="user").execute()
+            # Valid credentials need no round-trip to prove it; the first
+            # real call reports any auth error. Otherwise probe, at most
+            # once per PROBE_INTERVAL for the same token.
+            if not creds.valid:
+                probe_key = (self.account.name, creds.token)
+                probed = GDriveAdapter._PROBED.get(probe_key)
+                if probed is None or time.monotonic() - probed > PROBE_INTERVAL:
+                    await self._execute(self._service.about().get(fields="user"))
+                    GDriveAdapter._PROBED[probe_key] = time.monotonic()
+            
+            if self.account.config.get("preload_folders", True):
+                self._preload_task = asyncio.get_running_loop().create_task(self._preload_folders())
             
             logger.info(f"✅ Connected to Google Drive: {self.account.name}")
             return True
@@ -70,9 +125,105 @@ class GDriveAdapter(StorageAdapter):
     async def disconnect(self) -> None:
         """Disconnect from Google Drive."""
         self._service = None
+        self._http = None
+        self._root_id = None
+        self._path_cache.clear()
+        self._folder_tree.clear()
+        if self._preload_task is not None:
+            self._preload_task.cancel()
+            self._preload_task = None
+    
+    def _run_request(self, request):
+        """Execute a request or batch on this worker thread's transport."""
+        return self._http.execute(request)
+    
+    async def _execute(self, request):
+        """Run a prepared API request in a worker thread."""
+        return await asyncio.to_thread(self._run_request, request)
+    
+    async def _preload_folders(self) -> None:
+        """
+        Load the whole folder hierarchy into _folder_tree.
+        
+        Folders only, FOLDER_PAGE_SIZE per page, so this is usually a few
+        round-trips; afterwards most _resolve_path calls are a dict walk
+        until the entries expire. Runs in the background after connect and
+        only adds entries.
+        """
+        try:
+            if self._root_id is None:
+                root = await self._execute(self._service.files().get(fileId='root', fields='id'))
+                self._root_id = root['id']
+            
+            tree: Dict[Tuple[str, str], Tuple[str, float]] = {}
+            now = time.monotonic()
+            token = None
+            while True:
+                params = {
+                    "q": f"mimeType='{FOLDER_MIME}' and trashed=false",
+                    "fields": "nextPageToken, files(id, name, parents)",
+                    "pageSize": FOLDER_PAGE_SIZE,
+                }
+                if token:
+                    params["pageToken"] = token
+                results = await self._execute(self._service.files().list(**params))
+                for folder in results.get('files', ()):
+                    for parent in folder.get('parents', ()):
+                        parent = "root" if parent == self._root_id else parent
+                        tree.setdefault((parent, folder['name']), (folder['id'], now))
+                token = results.get('nextPageToken')
+                if not token:
+                    break
+            
+            # Entries added by lookups or mkdir while loading are newer
+            tree.update(self._folder_tree)
+            self._folder_tree = tree
+            logger.info(f"Preloaded {len(tree)} Drive folders for {self.account.name}")
+        except Exception as e:
+            logger.warning(f"Folder preload failed, resolving paths on demand: {e}")
+    
+    async def _batch_execute(self, requests: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send requests through the batch endpoint, BATCH_SIZE per HTTP call.
+        
+        Returns each request's response, or the exception it raised, under
+        its key. Chunks run concurrently, at most BULK_CONCURRENCY at a time.
+        """
+        results: Dict[str, Any] = {}
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        keys = list(requests)
+        
+        def callback(request_id, response, exception):
+            results[request_id] = response if exception is None else exception
+        
+        async def send(chunk):
+            async with semaphore:
+                batch = self._service.new_batch_http_request(callback=callback)
+                for key in chunk:
+                    batch.add(requests[key], request_id=key)
+                try:
+                    await asyncio.to_thread(self._run_request, batch)
+                except Exception as e:
+                    for key in chunk:
+                        results.setdefault(key, e)
+        
+        await asyncio.gather(*(
+            send(keys[start:start + BATCH_SIZE]) for start in range(0, len(keys), BATCH_SIZE)
+        ))
+        return results
     
-    def _resolve_path(self, path: str) -> str:
-        """Resolve a path like '/Supernote/Note' to a folder ID."""
+    async def _resolve_path(self, path: str, cached_misses: bool = True) -> str:
+        """
+        Resolve a path like '/Supernote/Note' to a folder ID.
+        
+        The folder tree is walked first, as far as its entries are younger
+        than PATH_CACHE_TTL, so folders deleted or recreated elsewhere are
+        looked up again. Past that, every prefix walked is cached for
+        PATH_CACHE_TTL seconds, and so is a miss, so repeated operations in
+        one subtree skip the per-segment lookups. Writes that change folders
+        call _invalidate_path. With cached_misses=False a cached miss is
+        looked up again, for callers where a stale miss would misplace data.
+        """
         if not path or path == "/":
             return "root"
         
@@ -80,48 +231,190 @@ class GDriveAdapter(StorageAdapter):
             return path
         
         parts = [p for p in path.split("/") if p]
-        current_id = "root"
         
+        # No awaits until the walk is done, so the local alias cannot go
+        # stale when _preload_folders swaps in a new tree
+        tree = self._folder_tree
+        now = time.monotonic()
+        tree_id = "root"
+        depth = 0
         for part in parts:
-            query = f"name='{part}' and '{current_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id, name)").execute()
+            child = tree.get((tree_id, part))
+            if child is None or now - child[1] >= PATH_CACHE_TTL:
+                break
+            tree_id = child[0]
+            depth += 1
+        if depth == len(parts):
+            return tree_id
+        
+        cache = self._path_cache
+        
+        # Start from the deepest fresh cached prefix, or the tree walk if deeper
+        current_id = tree_id
+        start = depth
+        for i in range(len(parts), depth, -1):
+            key = "/" + "/".join(parts[:i])
+            entry = cache.get(key)
+            if entry is None:
+                continue
+            if now - entry[1] >= PATH_CACHE_TTL:
+                del cache[key]
+                continue
+            cache.move_to_end(key)
+            if entry[0] is None:
+                if not cached_misses:
+                    continue
+                raise ValueError(f"Folder not found: {parts[i - 1]} in path {path}")
+            current_id, start = entry[0], i
+            break
+        
+        if len(parts) - start > 1:
+            current_id, start = await self._resolve_batched(parts, start, current_id, now)
+        
+        for i in range(start, len(parts)):
+            part = parts[i]
+            query = f"name='{_q_escape(part)}' and '{_q_escape(current_id)}' in parents and mimeType='{FOLDER_MIME}' and trashed=false"
+            results = await self._execute(self._service.files().list(q=query, fields="files(id, name)"))
             files = results.get('files', [])
             
+            key = "/" + "/".join(parts[:i + 1])
             if not files:
+                self._cache_path(key, None, now)
                 raise ValueError(f"Folder not found: {part} in path {path}")
+            # Re-read after the await: a finished preload replaces the tree
+            self._folder_tree[(current_id, part)] = (files[0]['id'], now)
             current_id = files[0]['id']
+            self._cache_path(key, current_id, now)
         
         return current_id
     
-    async def upload(self, local_path: Path, remote_path: str) -> str:
-        """Upload file to Google Drive."""
+    async def _resolve_batched(
+        self,
+        parts: List[str],
+        start: int,
+        current_id: str,
+        now: float
+    ) -> Tuple[str, int]:
+        """
+        Look up the remaining path segments in one batch HTTP request.
+        
+        Each segment is queried by name alone and the chain is stitched
+        back together through the returned parents. Returns the deepest
+        folder ID reached and the index to continue from; segments that
+        could not be stitched are left for the per-segment walk.
+        """
+        found: Dict[str, dict] = {}
+        
+        def callback(request_id, response, exception):
+            if exception is None:
+                found[request_id] = response
+            else:
+                logger.warning(f"Path lookup {request_id} failed: {exception}")
+        
+        try:
+            files = self._service.files()
+            batch = self._service.new_batch_http_request(callback=callback)
+            if self._root_id is None:
+                batch.add(files.get(fileId='root', fields='id'), request_id='root')
+            for i in range(start, len(parts)):
+                query = f"name='{_q_escape(parts[i])}' and mimeType='{FOLDER_MIME}' and trashed=false"
+                batch.add(
+                    files.list(q=query, fields="files(id, parents)", pageSize=1000),
+                    request_id=str(i)
+                )
+            await asyncio.to_thread(self._run_request, batch)
+        except Exception as e:
+            logger.warning(f"Batched path lookup failed, walking segments: {e}")
+            return current_id, start
+        
+        if 'root' in found:
+            self._root_id = found['root'].get('id')
+        
+        for i in range(start, len(parts)):
+            parent = self._root_id if current_id == "root" else current_id
+            match = next(
+                (f['id'] for f in found.get(str(i), {}).get('files', ()) if parent in f.get('parents', ())),
+                None
+            )
+            if match is None:
+                return current_id, i
+            self._folder_tree[(current_id, parts[i])] = (match, now)
+            current_id = match
+            self._cache_path("/" + "/".join(parts[:i + 1]), current_id, now)
+        
+        return current_id, len(parts)
+    
+    def _cache_path(self, key: str, folder_id: Optional[str], now: float) -> None:
+        """Record a resolved path (None for a miss), evicting past PATH_CACHE_SIZE."""
+        cache = self._path_cache
+        cache[key] = (folder_id, now)
+        cache.move_to_end(key)
+        while len(cache) > PATH_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _invalidate_path(self, path: str) -> None:
+        """Drop cached IDs for a path and everything below it."""
+        key = "/" + "/".join(p for p in path.split("/") if p)
+        prefix = key.rstrip("/") + "/"
+        for cached in [k for k in self._path_cache if k == key or k.startswith(prefix)]:
+            del self._path_cache[cached]
+    
+    async def _find_child(self, parent_id: str, name: str, fields: str = "id") -> Optional[dict]:
+        """Find a non-trashed item by name directly under a folder ID."""
+        query = f"name='{_q_escape(name)}' and '{_q_escape(parent_id)}' in parents and trashed=false"
+        results = await self._execute(
+            self._service.files().list(q=query, fields=f"files({fields})", pageSize=1)
+        )
+        files = results.get('files', [])
+        return files[0] if files else None
+    
+    async def _find_by_path(self, remote_path: str, fields: str = "id") -> Tuple[Optional[dict], str]:
+        """
+        Look up the item at remote_path with one files().list call.
+        
+        The parent is resolved through the path cache, so on a warm cache
+        this is a single round-trip. Returns (item or None, parent_id);
+        raises ValueError if the parent folder does not exist.
+        """
+        file_name, parent_path = _split(remote_path)
+        parent_id = await self._resolve_path(parent_path)
+        return await self._find_child(parent_id, file_name, fields), parent_id
+    
+    async def upload(self, local_path: Path, remote_path: str, overwrite: bool = True) -> str:
+        """
+        Upload file to Google Drive.
+        
+        Drive allows duplicate names, so a create never conflicts; with
+        overwrite=True an existing file is looked up and updated in place.
+        Callers that know the file is new pass overwrite=False to skip it.
+        """
         if not self._service:
             return "❌ Not connected to Google Drive"
         
         try:
             from googleapiclient.http import MediaFileUpload
             
-            file_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
+            file_name, parent_path = _split(remote_path)
             
             try:
-                parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
+                # A folder created elsewhere since a cached miss must not
+                # send the upload to the root
+                parent_id = await self._resolve_path(parent_path, cached_misses=False)
             except ValueError:
                 parent_id = "root"
             
-            query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            existing = results.get('files', [])
+            existing = await self._find_child(parent_id, file_name) if overwrite else None
             
-            media = MediaFileUpload(str(local_path), resumable=True)
+            resumable = local_path.stat().st_size >= RESUMABLE_THRESHOLD
+            media = MediaFileUpload(str(local_path), resumable=resumable, chunksize=CHUNK_SIZE)
             
             if existing:
-                file_id = existing[0]['id']
-                self._service.files().update(fileId=file_id, media_body=media).execute()
+                file_id = existing['id']
+                await self._execute(self._service.files().update(fileId=file_id, media_body=media, fields='id'))
                 return f"✅ Updated: {remote_path}"
             else:
                 metadata = {'name': file_name, 'parents': [parent_id]}
-                self._service.files().create(body=metadata, media_body=media, fields='id').execute()
+                await self._execute(self._service.files().create(body=metadata, media_body=media, fields='id'))
                 return f"✅ Uploaded: {remote_path}"
                 
         except Exception as e:
@@ -135,103 +428,153 @@ class GDriveAdapter(StorageAdapter):
         try:
             from googleapiclient.http import MediaIoBaseDownload
             
-            file_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
-            
             try:
-                parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
+                item, _ = await self._find_by_path(remote_path)
             except ValueError:
                 return f"❌ Path not found: {remote_path}"
             
-            query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            files = results.get('files', [])
-            
-            if not files:
+            if not item:
                 return f"❌ File not found: {remote_path}"
             
-            file_id = files[0]['id']
+            file_id = item['id']
             request = self._service.files().get_media(fileId=file_id)
             
             local_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(local_path, 'wb') as f:
-                downloader = MediaIoBaseDownload(f, request)
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
+            def fetch():
+                request.http = self._http.get()
+                with open(local_path, 'wb', buffering=1024 * 1024) as f:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    downloader = MediaIoBaseDownload(f, request, chunksize=CHUNK_SIZE)
+                    done = False
+                    while not done:
+                        status, done = downloader.next_chunk()
+            
+            await asyncio.to_thread(fetch)
             
             return f"✅ Downloaded: {remote_path} → {local_path}"
             
         except Exception as e:
             return f"❌ Download failed: {e}"
     
+    async def download_many(self, pairs: List[Tuple[str, Path]]) -> str:
+        """
+        Download several files concurrently, reporting in input order.
+        
+        Each download streams to disk in its own worker thread, with at most
+        BULK_CONCURRENCY in flight.
+        """
+        if not self._service:
+            return "❌ Not connected to Google Drive"
+        
+        await self._warm_parents([remote for remote, _ in pairs])
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        
+        async def fetch(remote_path, local_path):
+            async with semaphore:
+                return await self.download(remote_path, local_path)
+        
+        return "\n".join(await asyncio.gather(*(fetch(r, l) for r, l in pairs)))
+    
+    async def _list_page(
+        self,
+        parent_id: str,
+        remote_path: str,
+        page_size: int,
+        cursor: Optional[str] = None
+    ) -> FilePage:
+        """Fetch and parse one page of a folder listing."""
+        request_params = {
+            "q": f"'{_q_escape(parent_id)}' in parents and trashed=false",
+            "fields": "nextPageToken, files(id, name, size, modifiedTime, mimeType)",
+            "orderBy": "name",
+            "pageSize": min(page_size, 1000)
+        }
+        if cursor:
+            request_params["pageToken"] = cursor
+        
+        results = await self._execute(self._service.files().list(**request_params))
+        
+        # Drive returns RFC 3339 with a trailing Z, which fromisoformat
+        # accepts directly on Python 3.11+
+        fromiso = datetime.fromisoformat
+        account = self.account.name
+        prefix = remote_path if remote_path.endswith("/") else remote_path + "/"
+        files = [
+            FileInfo(
+                name=item['name'],
+                path=prefix + item['name'],
+                size=int(item.get('size', 0)),
+                modified=fromiso(item['modifiedTime']) if 'modifiedTime' in item else None,
+                is_directory=item['mimeType'] == FOLDER_MIME,
+                mime_type=item.get('mimeType'),
+                id=item.get('id'),
+                provider="gdrive",
+                account=account
+            )
+            for item in results.get('files', ())
+        ]
+        
+        return FilePage(
+            files=files,
+            next_cursor=results.get('nextPageToken')
+        )
+    
     async def list_files(self, remote_path: str = "/", limit: int = 100, cursor: Optional[str] = None) -> FilePage:
         """List files in Google Drive folder."""
         if not self._service:
             return FilePage(files=[])
         
         try:
-            parent_id = self._resolve_path(remote_path)
-            
-            query = f"'{parent_id}' in parents and trashed=false"
-            request_params = {
-                "q": query,
-                "fields": "nextPageToken, files(id, name, size, modifiedTime, mimeType)",
-                "orderBy": "name",
-                "pageSize": min(limit, 1000)
-            }
-            if cursor:
-                request_params["pageToken"] = cursor
-            
-            results = self._service.files().list(**request_params).execute()
-            
-            files = []
-            for item in results.get('files', []):
-                is_dir = item['mimeType'] == 'application/vnd.google-apps.folder'
-                modified = None
-                if 'modifiedTime' in item:
-                    modified = datetime.fromisoformat(item['modifiedTime'].replace('Z', '+00:00'))
-                
-                files.append(FileInfo(
-                    name=item['name'],
-                    path=f"{remote_path}/{item['name']}".replace("//", "/"),
-                    size=int(item.get('size', 0)),
-                    modified=modified,
-                    is_directory=is_dir,
-                    mime_type=item.get('mimeType'),
-                    id=item.get('id'),
-                    provider="gdrive",
-                    account=self.account.name
-                ))
-            
-            return FilePage(
-                files=files,
-                next_cursor=results.get('nextPageToken')
-            )
+            parent_id = await self._resolve_path(remote_path)
+            return await self._list_page(parent_id, remote_path, limit, cursor)
             
         except Exception as e:
             logger.error(f"List failed: {e}")
             return FilePage(files=[])
     
+    async def iter_files(self, remote_path: str = "/", page_size: int = 1000) -> AsyncIterator[FileInfo]:
+        """
+        Yield every file in a folder, following page tokens as needed.
+        
+        The next page is requested while the current one is being consumed,
+        and a caller that stops early never fetches the pages it skipped.
+        """
+        if not self._service:
+            return
+        
+        parent_id = await self._resolve_path(remote_path)
+        page = await self._list_page(parent_id, remote_path, page_size)
+        while True:
+            next_page = None
+            if page.next_cursor:
+                next_page = asyncio.ensure_future(
+                    self._list_page(parent_id, remote_path, page_size, page.next_cursor)
+                )
+            try:
+                for info in page.files:
+                    yield info
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            page = await next_page
+    
     async def exists(self, remote_path: str) -> bool:
         """Check if file exists in Google Drive."""
         if not self._service:
             return False
         
         try:
-            file_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
-            
             try:
-                parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
+                item, _ = await self._find_by_path(remote_path)
             except ValueError:
                 return False
             
-            query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            
-            return len(results.get('files', [])) > 0
+            return item is not None
             
         except Exception:
             return False
@@ -242,22 +585,17 @@ class GDriveAdapter(StorageAdapter):
             return "❌ Not connected to Google Drive"
         
         try:
-            file_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
-            
             try:
-                parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
+                item, parent_id = await self._find_by_path(remote_path)
             except ValueError:
                 return f"❌ Path not found: {remote_path}"
             
-            query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            files = results.get('files', [])
-            
-            if not files:
+            if not item:
                 return f"❌ File not found: {remote_path}"
             
-            self._service.files().delete(fileId=files[0]['id']).execute()
+            await self._execute(self._service.files().delete(fileId=item['id']))
+            self._folder_tree.pop((parent_id, _split(remote_path)[0]), None)
+            self._invalidate_path(remote_path)
             return f"✅ Deleted: {remote_path}"
             
         except Exception as e:
@@ -270,30 +608,28 @@ class GDriveAdapter(StorageAdapter):
         
         try:
             # Find source file
-            source_name = Path(source_path).name
-            source_parent = str(Path(source_path).parent)
-            source_parent_id = self._resolve_path(source_parent) if source_parent != "." else "root"
-            
-            query = f"name='{source_name}' and '{source_parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            files = results.get('files', [])
+            item, source_parent_id = await self._find_by_path(source_path)
             
-            if not files:
+            if not item:
                 return f"❌ Source not found: {source_path}"
             
-            file_id = files[0]['id']
-            dest_name = Path(dest_path).name
-            dest_parent = str(Path(dest_path).parent)
-            dest_parent_id = self._resolve_path(dest_parent) if dest_parent != "." else "root"
+            file_id = item['id']
+            dest_name, dest_parent = _split(dest_path)
+            dest_parent_id = await self._resolve_path(dest_parent)
             
             # Update file
-            self._service.files().update(
+            await self._execute(self._service.files().update(
                 fileId=file_id,
                 body={'name': dest_name},
                 addParents=dest_parent_id,
                 removeParents=source_parent_id,
                 fields='id'
-            ).execute()
+            ))
+            moved_folder = self._folder_tree.pop((source_parent_id, _split(source_path)[0]), None)
+            if moved_folder is not None:
+                self._folder_tree[(dest_parent_id, dest_name)] = (moved_folder[0], time.monotonic())
+            self._invalidate_path(source_path)
+            self._invalidate_path(dest_path)
             
             return f"✅ Moved: {source_path} → {dest_path}"
             
@@ -306,26 +642,21 @@ class GDriveAdapter(StorageAdapter):
             return "❌ Not connected to Google Drive"
         
         try:
-            source_name = Path(source_path).name
-            source_parent = str(Path(source_path).parent)
-            source_parent_id = self._resolve_path(source_parent) if source_parent != "." else "root"
-            
-            query = f"name='{source_name}' and '{source_parent_id}' in parents and trashed=false"
-            results = self._service.files().list(q=query, fields="files(id)").execute()
-            files = results.get('files', [])
+            item, _ = await self._find_by_path(source_path)
             
-            if not files:
+            if not item:
                 return f"❌ Source not found: {source_path}"
             
-            file_id = files[0]['id']
-            dest_name = Path(dest_path).name
-            dest_parent = str(Path(dest_path).parent)
-            dest_parent_id = self._resolve_path(dest_parent) if dest_parent != "." else "root"
+            file_id = item['id']
+            dest_name, dest_parent = _split(dest_path)
+            dest_parent_id = await self._resolve_path(dest_parent)
             
-            self._service.files().copy(
+            await self._execute(self._service.files().copy(
                 fileId=file_id,
-                body={'name': dest_name, 'parents': [dest_parent_id]}
-            ).execute()
+                body={'name': dest_name, 'parents': [dest_parent_id]},
+                fields='id'
+            ))
+            self._invalidate_path(dest_path)
             
             return f"✅ Copied: {source_path} → {dest_path}"
             
@@ -338,16 +669,17 @@ class GDriveAdapter(StorageAdapter):
             return "❌ Not connected to Google Drive"
         
         try:
-            folder_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
-            parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
+            folder_name, parent_path = _split(remote_path)
+            parent_id = await self._resolve_path(parent_path)
             
             metadata = {
                 'name': folder_name,
-                'mimeType': 'application/vnd.google-apps.folder',
+                'mimeType': FOLDER_MIME,
                 'parents': [parent_id]
             }
-            self._service.files().create(body=metadata, fields='id').execute()
+            created = await self._execute(self._service.files().create(body=metadata, fields='id'))
+            self._folder_tree[(parent_id, folder_name)] = (created['id'], time.monotonic())
+            self._invalidate_path(remote_path)
             
             return f"✅ Created folder: {remote_path}"
             
@@ -365,32 +697,17 @@ class GDriveAdapter(StorageAdapter):
             return None
         
         try:
-            file_name = Path(remote_path).name
-            parent_path = str(Path(remote_path).parent)
-            parent_id = self._resolve_path(parent_path) if parent_path != "." else "root"
-            
-            query = f"name='{file_name}' and '{parent_id}' in parents and trashed=false"
-            results = self._service.files().list(
-                q=query,
-                fields="files(id, name, size, modifiedTime, mimeType)"
-            ).execute()
-            files = results.get('files', [])
+            item, _ = await self._find_by_path(remote_path, "id, name, size, modifiedTime, mimeType")
             
-            if not files:
+            if not item:
                 return None
             
-            item = files[0]
-            is_dir = item['mimeType'] == 'application/vnd.google-apps.folder'
-            modified = None
-            if 'modifiedTime' in item:
-                modified = datetime.fromisoformat(item['modifiedTime'].replace('Z', '+00:00'))
-            
             return FileInfo(
                 name=item['name'],
                 path=remote_path,
                 size=int(item.get('size', 0)),
-                modified=modified,
-                is_directory=is_dir,
+                modified=datetime.fromisoformat(item['modifiedTime']) if 'modifiedTime' in item else None,
+                is_directory=item['mimeType'] == FOLDER_MIME,
                 mime_type=item.get('mimeType'),
                 id=item.get('id'),
                 provider="gdrive",
@@ -399,3 +716,101 @@ class GDriveAdapter(StorageAdapter):
             
         except Exception:
             return None
+    
+    async def _warm_parents(self, remote_paths: List[str]) -> None:
+        """Resolve each distinct parent folder once before a bulk lookup fans out."""
+        parents = {_split(p)[1] for p in remote_paths} - {"/"}
+        await asyncio.gather(*(self._resolve_path(p) for p in parents), return_exceptions=True)
+    
+    async def _batch_lookup(self, remote_paths: List[str]) -> Dict[str, Tuple[str, Any]]:
+        """
+        Look up several paths with batch HTTP requests.
+        
+        Returns str(index) -> (parent ID, files().list response or the
+        exception it raised). Paths whose parent folder does not exist are
+        left out. Once parents are known this costs ceil(N / BATCH_SIZE)
+        round-trips.
+        """
+        await self._warm_parents(remote_paths)
+        
+        lookups: Dict[str, Any] = {}
+        parents: Dict[str, str] = {}
+        files = self._service.files()
+        for i, path in enumerate(remote_paths):
+            name, parent_path = _split(path)
+            try:
+                parent_id = await self._resolve_path(parent_path)
+            except ValueError:
+                continue
+            parents[str(i)] = parent_id
+            query = f"name='{_q_escape(name)}' and '{_q_escape(parent_id)}' in parents and trashed=false"
+            lookups[str(i)] = files.list(q=query, fields="files(id)", pageSize=1)
+        
+        results = await self._batch_execute(lookups)
+        return {key: (parents[key], result) for key, result in results.items()}
+    
+    async def exists_many(self, remote_paths: List[str]) -> Dict[str, bool]:
+        """
+        Check several paths with batch HTTP lookups.
+        
+        Paths whose parent is missing or whose lookup fails report False,
+        as exists() does.
+        """
+        results = dict.fromkeys(remote_paths, False)
+        if not self._service:
+            return results
+        
+        for key, (_, result) in (await self._batch_lookup(remote_paths)).items():
+            if not isinstance(result, Exception):
+                results[remote_paths[int(key)]] = bool(result.get('files'))
+        return results
+    
+    async def bulk_get_info(self, remote_paths: List[str]) -> List[Optional[FileInfo]]:
+        """Get info for several paths concurrently, in input order."""
+        await self._warm_parents(remote_paths)
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        
+        async def info(path):
+            async with semaphore:
+                return await self.get_info(path)
+        
+        return list(await asyncio.gather(*(info(p) for p in remote_paths)))
+    
+    async def delete_many(self, remote_paths: List[str]) -> str:
+        """
+        Delete several files or folders with batch HTTP requests.
+        
+        Lookups and deletes each go out BATCH_SIZE per call, so N paths
+        cost about 2 * ceil(N / BATCH_SIZE) round-trips once parents are known.
+        """
+        if not self._service:
+            return "❌ Not connected to Google Drive"
+        
+        found = await self._batch_lookup(remote_paths)
+        errors = [
+            f"❌ Path not found: {path}"
+            for i, path in enumerate(remote_paths) if str(i) not in found
+        ]
+        
+        deletes: Dict[str, Any] = {}
+        files = self._service.files()
+        for key, (_, result) in found.items():
+            path = remote_paths[int(key)]
+            if isinstance(result, Exception):
+                errors.append(f"❌ Lookup failed: {path}: {result}")
+            elif not result.get('files'):
+                errors.append(f"❌ File not found: {path}")
+            else:
+                deletes[key] = files.delete(fileId=result['files'][0]['id'])
+        
+        deleted = 0
+        for key, result in (await self._batch_execute(deletes)).items():
+            path = remote_paths[int(key)]
+            if isinstance(result, Exception):
+                errors.append(f"❌ Delete failed: {path}: {result}")
+                continue
+            deleted += 1
+            self._folder_tree.pop((found[key][0], _split(path)[0]), None)
+            self._invalidate_path(path)
+        
+        return "\n".join([f"✅ Deleted {deleted} of {len(remote_paths)} files"] + errors)
@@ -5,14 +5,15 @@ Core abstraction for cloud storage providers. Adapters implement this interface
 to provide storage functionality for Google Drive, OneDrive, Dropbox, etc.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a remote file."""
     name: str
@@ -26,14 +27,14 @@ class FileInfo:
     account: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FilePage:
     """Paginated file listing results."""
     files: List[FileInfo]
     next_cursor: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageAccount:
     """A named storage account configuration."""
     name: str
@@ -62,8 +63,8 @@ class StorageAdapter(ABC):
         pass
     
     @abstractmethod
-    async def upload(self, local_path: Path, remote_path: str) -> str:
-        """Upload a file to remote storage."""
+    async def upload(self, local_path: Path, remote_path: str, overwrite: bool = True) -> str:
+        """Upload a file, replacing an existing one at remote_path unless overwrite is False."""
         pass
     
     @abstractmethod
@@ -124,3 +125,47 @@ class StorageAdapter(ABC):
     ) -> List[FileInfo]:
         """Search for files. Override if provider supports it."""
         return []
+    
+    async def search_paged(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> FilePage:
+        """
+        Search for files a page at a time.
+        
+        The default slices search() results using "offset:N" cursors; override
+        if the provider pages search results natively.
+        """
+        offset = int(cursor[len("offset:"):]) if cursor else 0
+        # One extra result tells whether another page exists
+        results = await self.search(query, path, offset + limit + 1)
+        files = results[offset:offset + limit]
+        next_cursor = f"offset:{offset + limit}" if len(results) > offset + limit else None
+        return FilePage(files=files, next_cursor=next_cursor)
+    
+    async def iter_files(self, remote_path: str = "/", page_size: int = 1000) -> AsyncIterator[FileInfo]:
+        """Yield every file at a remote path, following list_files cursors."""
+        cursor = None
+        while True:
+            page = await self.list_files(remote_path, page_size, cursor)
+            for info in page.files:
+                yield info
+            cursor = page.next_cursor
+            if not cursor:
+                return
+    
+    async def exists_many(self, remote_paths: List[str]) -> Dict[str, bool]:
+        """Check several paths at once. Override if provider supports batch lookups."""
+        results = await asyncio.gather(*(self.exists(path) for path in remote_paths))
+        return dict(zip(remote_paths, results))
+    
+    async def delete_many(self, remote_paths: List[str]) -> str:
+        """Delete several remote files. Override if provider supports batching."""
+        return "\n".join([await self.delete(path) for path in remote_paths])
+    
+    async def download_many(self, pairs: List[Tuple[str, Path]]) -> str:
+        """Download several (remote_path, local_path) pairs. Override to run them concurrently."""
+        return "\n".join([await self.download(remote, local) for remote, local in pairs])
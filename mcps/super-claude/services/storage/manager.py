@@ -4,17 +4,29 @@ Storage Account Manager
 Manages named storage accounts and adapter instances.
 """
 
-import json
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Optional, Type, List
+from typing import AsyncIterator, Dict, Optional, Type, List, Tuple
 import logging
 
+from ..servicejson import read_config, write_config
 from .interface import StorageAdapter, StorageAccount, FileInfo, FilePage
 
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE = Path("/data/config/storage_accounts.json")
 
+# Adapters unused for this many seconds are disconnected and dropped
+IDLE_DISCONNECT_AFTER = 900
+
+# Seconds a directory listing is served from cache, and how many are kept
+LISTING_TTL = 15
+LISTING_CACHE_SIZE = 512
+
 
 class StorageManager:
     """
@@ -29,6 +41,13 @@ class StorageManager:
         self.accounts: Dict[str, StorageAccount] = {}
         self.adapters: Dict[str, StorageAdapter] = {}
         self.adapter_classes: Dict[str, Type[StorageAdapter]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_used: Dict[str, float] = {}
+        # Account name -> operations currently running on its adapter
+        self._in_use: Dict[str, int] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        # (account, path, limit, cursor) -> (time listed, page)
+        self._listings: "OrderedDict[Tuple[str, str, int, Optional[str]], Tuple[float, FilePage]]" = OrderedDict()
         
         self._load_accounts()
     
@@ -39,35 +58,46 @@ class StorageManager:
     
     def _load_accounts(self) -> None:
         """Load accounts from config file."""
-        if not self.config_path.exists():
-            logger.info("No storage accounts config found, starting fresh")
-            return
-        
         try:
-            config = json.loads(self.config_path.read_text())
+            config = read_config(self.config_path)
             for name, data in config.get("accounts", {}).items():
                 self.accounts[name] = StorageAccount(
                     name=name,
                     adapter=data.get("provider", data.get("adapter", "")),  # Support both old "provider" and new "adapter"
                     credentials_ref=data.get("credentials_ref", ""),
-                    config=data.get("config", {})
+                    config=dict(data.get("config", {}))
                 )
             logger.info(f"✅ Loaded {len(self.accounts)} storage accounts")
+        except FileNotFoundError:
+            logger.info("No storage accounts config found, starting fresh")
         except Exception as e:
             logger.error(f"❌ Failed to load accounts: {e}")
     
     def _save_accounts(self) -> None:
-        """Save accounts to config file."""
+        """
+        Save accounts to config file.
+        
+        The write is durable (fsynced), since a change is only reported as
+        done once it is on disk.
+        """
         config = {"accounts": {}}
         for name, account in self.accounts.items():
             config["accounts"][name] = {
                 "adapter": account.adapter,
                 "credentials_ref": account.credentials_ref,
-                "config": account.config
+                "config": dict(account.config)
             }
         
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        self.config_path.write_text(json.dumps(config, indent=2))
+        write_config(self.config_path, config, durable=True)
+    
+    def _persist(self) -> Optional[str]:
+        """Write accounts to the config file; returns the error message on failure."""
+        try:
+            self._save_accounts()
+        except Exception as e:
+            logger.error(f"❌ Failed to save accounts: {e}")
+            return str(e)
+        return None
     
     def add_account(
         self,
@@ -90,7 +120,10 @@ class StorageManager:
             credentials_ref=credentials_ref,
             config=config or {}
         )
-        self._save_accounts()
+        error = self._persist()
+        if error:
+            del self.accounts[name]
+            return f"❌ Failed to save account '{name}': {error}"
         
         return f"✅ Added storage account: {name} ({adapter})"
     
@@ -99,11 +132,17 @@ class StorageManager:
         if name not in self.accounts:
             return f"❌ Account '{name}' not found"
         
+        account = self.accounts.pop(name)
+        error = self._persist()
+        if error:
+            self.accounts[name] = account
+            return f"❌ Failed to remove account '{name}': {error}"
+        
         if name in self.adapters:
             del self.adapters[name]
-        
-        del self.accounts[name]
-        self._save_accounts()
+        self._last_used.pop(name, None)
+        self._locks.pop(name, None)
+        self._invalidate_listings(name, "/")
         
         return f"✅ Removed storage account: {name}"
     
@@ -122,11 +161,30 @@ class StorageManager:
         return "\n".join(lines)
     
     async def get_adapter(self, account_name: str) -> Optional[StorageAdapter]:
-        """Get or create an adapter instance for an account."""
+        """
+        Get or create an adapter instance for an account.
+        
+        Connecting happens under a per-account lock, so concurrent first
+        uses share one adapter instead of each running the auth flow.
+        """
         if account_name not in self.accounts:
             logger.error(f"Account not found: {account_name}")
             return None
         
+        adapter = self.adapters.get(account_name)
+        if adapter is None:
+            lock = self._locks.setdefault(account_name, asyncio.Lock())
+            async with lock:
+                adapter = await self._connect_adapter(account_name)
+        
+        if adapter is not None:
+            self._last_used[account_name] = time.monotonic()
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.get_running_loop().create_task(self._reap_idle())
+        return adapter
+    
+    async def _connect_adapter(self, account_name: str) -> Optional[StorageAdapter]:
+        """Return the cached adapter for an account, connecting one if needed."""
         if account_name in self.adapters:
             return self.adapters[account_name]
         
@@ -150,34 +208,154 @@ class StorageManager:
         
         return None
     
-    # Convenience methods that route to the appropriate adapter
+    async def _reap_idle(self) -> None:
+        """
+        Disconnect adapters idle past IDLE_DISCONNECT_AFTER; exits once none are left.
+        
+        Adapters with calls in flight through _use are never idle.
+        """
+        while self.adapters:
+            await asyncio.sleep(IDLE_DISCONNECT_AFTER / 3)
+            now = time.monotonic()
+            for name in list(self.adapters):
+                if self._in_use.get(name) or now - self._last_used.get(name, 0.0) <= IDLE_DISCONNECT_AFTER:
+                    continue
+                adapter = self.adapters.pop(name)
+                logger.info(f"Disconnecting idle storage account: {name}")
+                try:
+                    await adapter.disconnect()
+                except Exception as e:
+                    logger.warning(f"Disconnect failed for {name}: {e}")
     
-    async def upload(self, account_name: str, local_path: Path, remote_path: str) -> str:
+    @asynccontextmanager
+    async def _use(self, account_name: str) -> AsyncIterator[Optional[StorageAdapter]]:
+        """
+        Yield the account's adapter (None if unavailable) for one operation.
+        
+        The operation counts as in flight until the block exits, and
+        _last_used is refreshed then, so long transfers and slowly consumed
+        iter_files streams are not disconnected by the reaper mid-way.
+        """
         adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.upload(local_path, remote_path)
+        if adapter is None:
+            yield None
+            return
+        self._in_use[account_name] = self._in_use.get(account_name, 0) + 1
+        try:
+            yield adapter
+        finally:
+            count = self._in_use.pop(account_name) - 1
+            if count:
+                self._in_use[account_name] = count
+            if account_name in self.adapters:
+                self._last_used[account_name] = time.monotonic()
+    
+    def _invalidate_listings(self, account_name: str, remote_path: str) -> None:
+        """Drop cached listings of remote_path, its ancestors and its descendants."""
+        changed = remote_path.rstrip("/") + "/"
+        for key in [k for k in self._listings if k[0] == account_name]:
+            listed = key[1].rstrip("/") + "/"
+            if changed.startswith(listed) or listed.startswith(changed):
+                del self._listings[key]
+    
+    # Convenience methods that route to the appropriate adapter
+    
+    async def upload(self, account_name: str, local_path: Path, remote_path: str, overwrite: bool = True) -> str:
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return f"❌ Could not connect to account: {account_name}"
+            result = await adapter.upload(local_path, remote_path, overwrite)
+            self._invalidate_listings(account_name, remote_path)
+            return result
     
     async def download(self, account_name: str, remote_path: str, local_path: Path) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.download(remote_path, local_path)
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return f"❌ Could not connect to account: {account_name}"
+            return await adapter.download(remote_path, local_path)
     
     async def list_files(self, account_name: str, remote_path: str = "/", limit: int = 100, cursor: Optional[str] = None) -> FilePage:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return FilePage(files=[])
-        return await adapter.list_files(remote_path, limit, cursor)
+        """
+        List files at a remote path.
+        
+        Pages are cached for LISTING_TTL seconds, so repeated listings of
+        the same directory skip the provider. Changes made through this
+        manager drop the affected entries at once. Empty pages are not
+        cached: adapters report list errors as an empty page, and an
+        outage should not be served back as an empty directory. Callers
+        get a copy of the cached page, so changing it leaves the cache intact.
+        """
+        key = (account_name, remote_path, limit, cursor)
+        cached = self._listings.get(key)
+        if cached is not None and time.monotonic() - cached[0] < LISTING_TTL:
+            self._listings.move_to_end(key)
+            return replace(cached[1], files=list(cached[1].files))
+        
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return FilePage(files=[])
+            page = await adapter.list_files(remote_path, limit, cursor)
+            if not page.files:
+                return page
+        
+        self._listings[key] = (time.monotonic(), page)
+        self._listings.move_to_end(key)
+        while len(self._listings) > LISTING_CACHE_SIZE:
+            self._listings.popitem(last=False)
+        return replace(page, files=list(page.files))
+    
+    async def iter_files(self, account_name: str, remote_path: str = "/") -> AsyncIterator[FileInfo]:
+        """Yield every file at a remote path, fetching pages only as they are consumed."""
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return
+            async for info in adapter.iter_files(remote_path):
+                yield info
+    
+    async def search_paged(
+        self,
+        account_name: str,
+        query: str,
+        path: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> FilePage:
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return FilePage(files=[])
+            return await adapter.search_paged(query, path, limit, cursor)
     
     async def exists(self, account_name: str, remote_path: str) -> bool:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return False
-        return await adapter.exists(remote_path)
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return False
+            return await adapter.exists(remote_path)
+    
+    async def exists_many(self, account_name: str, remote_paths: List[str]) -> Dict[str, bool]:
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return dict.fromkeys(remote_paths, False)
+            return await adapter.exists_many(remote_paths)
     
     async def delete(self, account_name: str, remote_path: str) -> str:
-        adapter = await self.get_adapter(account_name)
-        if not adapter:
-            return f"❌ Could not connect to account: {account_name}"
-        return await adapter.delete(remote_path)
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return f"❌ Could not connect to account: {account_name}"
+            result = await adapter.delete(remote_path)
+            self._invalidate_listings(account_name, remote_path)
+            return result
+    
+    async def download_many(self, account_name: str, pairs: List[Tuple[str, Path]]) -> str:
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return f"❌ Could not connect to account: {account_name}"
+            return await adapter.download_many(pairs)
+    
+    async def delete_many(self, account_name: str, remote_paths: List[str]) -> str:
+        async with self._use(account_name) as adapter:
+            if not adapter:
+                return f"❌ Could not connect to account: {account_name}"
+            result = await adapter.delete_many(remote_paths)
+            for remote_path in remote_paths:
+                self._invalidate_listings(account_name, remote_path)
+            return result
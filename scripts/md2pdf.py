@@ -5,6 +5,8 @@ md2pdf - Convert Markdown to PDF for Supernote viewing
 Usage: python md2pdf.py input.md [output.pdf]
 """
 
+import functools
+import itertools
 import sys
 import re
 from pathlib import Path
@@ -15,40 +17,17 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-def parse_markdown_table(lines):
-    """Parse markdown table into list of lists."""
-    rows = []
-    for line in lines:
-        line = line.strip()
-        if line.startswith('|') and line.endswith('|'):
-            cells = [c.strip() for c in line[1:-1].split('|')]
-            # Skip separator rows (contain only dashes/colons)
-            if not all(re.match(r'^[-:]+$', c) for c in cells):
-                rows.append(cells)
-    return rows
+# Bold spans (**text**) in paragraphs, and table separator cells (---, :-:)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_SEP_RE = re.compile(r'[-:]+')
 
-def md_to_pdf(md_path, pdf_path=None):
-    """Convert markdown file to PDF."""
-    md_path = Path(md_path)
-    if pdf_path is None:
-        pdf_path = md_path.with_suffix('.pdf')
-    else:
-        pdf_path = Path(pdf_path)
-    
-    # Read markdown
-    content = md_path.read_text()
-    lines = content.split('\n')
-    
-    # Set up PDF
-    doc = SimpleDocTemplate(
-        str(pdf_path),
-        pagesize=letter,
-        rightMargin=0.5*inch,
-        leftMargin=0.5*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
-    
+# Flowables parsed ahead of layout: enough for keepWithNext look-ahead,
+# small enough that the whole story is never held in memory
+STORY_WINDOW = 64
+
+@functools.lru_cache(maxsize=1)
+def _styles():
+    """Build the paragraph styles once, on first use, and share them across calls."""
     styles = getSampleStyleSheet()
     
     # Custom styles
@@ -88,94 +67,142 @@ def md_to_pdf(md_path, pdf_path=None):
         textColor=colors.gray
     )
     
-    story = []
-    i = 0
+    return title_style, h2_style, h3_style, normal_style, small_style
+
+# Shared by every table; TableStyle is only read when a table is drawn
+_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#333333')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fafafa')]),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ('LEFTPADDING', (0, 0), (-1, -1), 4),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+])
+
+@functools.lru_cache(maxsize=16)
+def _col_widths(num_cols):
+    """Equal column widths across the 7.5in text width, cached per column count."""
+    return (7.5 * inch / num_cols,) * num_cols
+
+def parse_markdown_table(lines):
+    """Parse markdown table into list of lists. Lines must already be stripped."""
+    rows = []
+    for line in lines:
+        if line.startswith('|') and line.endswith('|'):
+            cells = [c.strip() for c in line[1:-1].split('|')]
+            # Skip separator rows (contain only dashes/colons)
+            if not all(map(_SEP_RE.fullmatch, cells)):
+                rows.append(cells)
+    return rows
+
+class _StoryStream(list):
+    """
+    Story list filled lazily from an iterator of flowables.
+    
+    doc.build() calls len() before laying out each flowable, so topping
+    the buffer up to STORY_WINDOW there lets finished flowables be freed
+    while later ones have not been parsed yet.
+    """
     
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Skip empty lines
-        if not line:
-            i += 1
-            continue
-        
-        # Skip blockquotes (like the Supernote note)
-        if line.startswith('>'):
-            i += 1
-            continue
-        
-        # Skip horizontal rules
-        if line == '---':
-            i += 1
-            continue
-        
-        # Title (# )
-        if line.startswith('# '):
-            story.append(Paragraph(line[2:], title_style))
-            i += 1
-            continue
-        
-        # H2 (## )
-        if line.startswith('## '):
-            story.append(Paragraph(line[3:], h2_style))
-            i += 1
-            continue
-        
-        # H3 (### )
-        if line.startswith('### '):
-            story.append(Paragraph(line[4:], h3_style))
-            i += 1
-            continue
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = flowables
+    
+    def __len__(self):
+        missing = STORY_WINDOW - list.__len__(self)
+        if missing > 0 and self._source is not None:
+            chunk = list(itertools.islice(self._source, missing))
+            if len(chunk) < missing:
+                self._source = None
+            self.extend(chunk)
+        return list.__len__(self)
+
+def _flowables(md_path):
+    """Yield the flowables for a markdown file, reading it a line at a time."""
+    title_style, h2_style, h3_style, normal_style, small_style = _styles()
+    
+    # Each line is stripped once. The table branch reads one line past the
+    # table, which is left in `line` to be dispatched next instead of
+    # being read again.
+    with md_path.open() as f:
+        lines = (raw.strip() for raw in f)
+        line = next(lines, None)
         
-        # Table
-        if line.startswith('|'):
-            table_lines = []
-            while i < len(lines) and lines[i].strip().startswith('|'):
-                table_lines.append(lines[i])
-                i += 1
+        while line is not None:
+            # Skip empty lines, blockquotes (like the Supernote note)
+            # and horizontal rules
+            if not line or line.startswith('>') or line == '---':
+                pass
+            
+            # Title (# )
+            elif line.startswith('# '):
+                yield Paragraph(line[2:], title_style)
+            
+            # H2 (## )
+            elif line.startswith('## '):
+                yield Paragraph(line[3:], h2_style)
+            
+            # H3 (### )
+            elif line.startswith('### '):
+                yield Paragraph(line[4:], h3_style)
             
-            rows = parse_markdown_table(table_lines)
-            if rows:
-                # Calculate column widths based on content
-                num_cols = len(rows[0])
-                available_width = 7.5 * inch
-                col_width = available_width / num_cols
-                col_widths = [col_width] * num_cols
+            # Table
+            elif line.startswith('|'):
+                table_lines = [line]
+                for line in lines:
+                    if not line.startswith('|'):
+                        break
+                    table_lines.append(line)
+                else:
+                    line = None
                 
-                t = Table(rows, colWidths=col_widths)
-                t.setStyle(TableStyle([
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#333333')),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fafafa')]),
-                    ('TOPPADDING', (0, 0), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-                ]))
-                story.append(t)
-                story.append(Spacer(1, 6))
-            continue
-        
-        # Italic text (standalone like *Generated...*)
-        if line.startswith('*') and line.endswith('*') and not line.startswith('**'):
-            text = line[1:-1]
-            story.append(Paragraph(f"<i>{text}</i>", small_style))
-            i += 1
-            continue
-        
-        # Regular paragraph
-        # Handle bold (**text**)
-        line = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', line)
-        story.append(Paragraph(line, normal_style))
-        i += 1
+                rows = parse_markdown_table(table_lines)
+                if rows:
+                    t = Table(rows, colWidths=list(_col_widths(len(rows[0]))))
+                    t.setStyle(_TABLE_STYLE)
+                    yield t
+                    yield Spacer(1, 6)
+                continue
+            
+            # Italic text (standalone like *Generated...*)
+            elif line.startswith('*') and line.endswith('*') and not line.startswith('**'):
+                text = line[1:-1]
+                yield Paragraph(f"<i>{text}</i>", small_style)
+            
+            # Regular paragraph
+            else:
+                # Handle bold (**text**)
+                line = _BOLD_RE.sub(r'<b>\1</b>', line)
+                yield Paragraph(line, normal_style)
+            
+            line = next(lines, None)
+
+def md_to_pdf(md_path, pdf_path=None):
+    """Convert markdown file to PDF."""
+    md_path = Path(md_path)
+    if pdf_path is None:
+        pdf_path = md_path.with_suffix('.pdf')
+    else:
+        pdf_path = Path(pdf_path)
+    
+    # Set up PDF
+    doc = SimpleDocTemplate(
+        str(pdf_path),
+        pagesize=letter,
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch
+    )
     
-    # Build PDF
-    doc.build(story)
+    # Build PDF, parsing the markdown only as layout consumes it
+    doc.build(_StoryStream(_flowables(md_path)))
     return pdf_path
 
 if __name__ == '__main__':
@@ -16,6 +16,9 @@ Usage:
         "op://Key Vault/Some Other Secret/password",
     ])
     
+    # Drop a cached value after rotating the secret
+    invalidate("op://Key Vault/GitHub PAT - Claude Code/credential")
+    
     # Create a new item
     await create_item(
         title="Steam API Key",
@@ -25,27 +28,110 @@ Usage:
     )
 """
 
+import asyncio
 import os
+import time
+from collections import OrderedDict
 from onepassword.client import Client
 from onepassword.types import ItemCreateParams, ItemField, ItemFieldType, ItemCategory
 
+# Seconds a resolved secret is reused before asking 1Password again.
+# A secret rotated in 1Password is seen after at most this long, or at
+# once after invalidate()/clear_cache()
+SECRET_TTL = 300
+
+# Most secrets kept cached; the least recently used are dropped first
+SECRET_CACHE_SIZE = 128
+
 _client: Client | None = None
 
+# Secret reference -> (time resolved, value)
+_secret_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# Lowercased vault title -> vault ID, filled from one vault listing
+_vault_ids: dict[str, str] = {}
+
+
+class _LoopState:
+    """Locks and in-flight lookups, which only work on the loop that made them."""
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.client_lock = asyncio.Lock()
+        self.vault_lock = asyncio.Lock()
+        # Lookups in flight, so concurrent requests for one reference share a fetch
+        self.pending: dict[str, asyncio.Task] = {}
+
+
+_loop_state: _LoopState | None = None
+
+
+def _state() -> _LoopState:
+    """State for the running loop, made afresh when a new loop (e.g. another asyncio.run) calls in."""
+    global _loop_state
+    loop = asyncio.get_running_loop()
+    if _loop_state is None or _loop_state.loop is not loop:
+        _loop_state = _LoopState(loop)
+    return _loop_state
+
+
+def invalidate(secret_ref: str) -> None:
+    """Drop the cached value for a secret reference, e.g. after rotating it."""
+    _secret_cache.pop(secret_ref, None)
+
+
+def clear_cache() -> None:
+    """Drop every cached secret value and vault ID."""
+    _secret_cache.clear()
+    _vault_ids.clear()
+
+
 async def _get_client() -> Client:
     """Get or create authenticated 1Password client."""
     global _client
     if _client is None:
-        token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
-        if not token:
-            raise ValueError("OP_SERVICE_ACCOUNT_TOKEN not set")
-        _client = await Client.authenticate(
-            auth=token,
-            integration_name="Claude MCP",
-            integration_version="v0.2.0"
-        )
+        # Concurrent first calls wait here instead of each authenticating
+        async with _state().client_lock:
+            if _client is None:
+                token = os.getenv("OP_SERVICE_ACCOUNT_TOKEN")
+                if not token:
+                    raise ValueError("OP_SERVICE_ACCOUNT_TOKEN not set")
+                _client = await Client.authenticate(
+                    auth=token,
+                    integration_name="Claude MCP",
+                    integration_version="v0.2.0"
+                )
     return _client
 
 
+async def _resolve(secret_ref: str) -> str:
+    """Resolve a secret reference, reusing a value cached within SECRET_TTL."""
+    entry = _secret_cache.get(secret_ref)
+    if entry is not None and time.monotonic() - entry[0] < SECRET_TTL:
+        _secret_cache.move_to_end(secret_ref)
+        return entry[1]
+    
+    pending = _state().pending
+    task = pending.get(secret_ref)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(secret_ref))
+        pending[secret_ref] = task
+        task.add_done_callback(lambda _: pending.pop(secret_ref, None))
+    # Shielded so one caller being cancelled doesn't fail the others
+    return await asyncio.shield(task)
+
+
+async def _fetch(secret_ref: str) -> str:
+    """Resolve a secret reference from 1Password and cache the value."""
+    client = await _get_client()
+    value = await client.secrets.resolve(secret_ref)
+    _secret_cache[secret_ref] = (time.monotonic(), value)
+    _secret_cache.move_to_end(secret_ref)
+    while len(_secret_cache) > SECRET_CACHE_SIZE:
+        _secret_cache.popitem(last=False)
+    return value
+
+
 async def get_secret(
     item_name: str,
     field: str = "credential",
@@ -65,9 +151,7 @@ async def get_secret(
     Raises:
         Exception: If secret cannot be retrieved
     """
-    client = await _get_client()
-    secret_ref = f"op://{vault}/{item_name}/{field}"
-    return await client.secrets.resolve(secret_ref)
+    return await _resolve(f"op://{vault}/{item_name}/{field}")
 
 
 async def get_secrets(secret_refs: list[str]) -> dict[str, str]:
@@ -95,8 +179,7 @@ async def get_secret_by_ref(secret_ref: str) -> str:
     Returns:
         The secret value
     """
-    client = await _get_client()
-    return await client.secrets.resolve(secret_ref)
+    return await _resolve(secret_ref)
 
 
 async def get_vault_id(vault_name: str) -> str:
@@ -112,12 +195,19 @@ async def get_vault_id(vault_name: str) -> str:
     Raises:
         ValueError: If vault not found
     """
-    client = await _get_client()
-    vaults = await client.vaults.list()
-    for vault in vaults:
-        if vault.title.lower() == vault_name.lower():
-            return vault.id
-    raise ValueError(f"Vault not found: {vault_name}")
+    key = vault_name.lower()
+    if key not in _vault_ids:
+        # An unknown name lists the vaults again, in case one was added
+        async with _state().vault_lock:
+            if key not in _vault_ids:
+                client = await _get_client()
+                vaults = await client.vaults.list()
+                _vault_ids.update({vault.title.lower(): vault.id for vault in vaults})
+    
+    vault_id = _vault_ids.get(key)
+    if vault_id is None:
+        raise ValueError(f"Vault not found: {vault_name}")
+    return vault_id
 
 
 async def create_item(
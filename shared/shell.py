@@ -4,10 +4,14 @@ Shared shell execution utilities for Super Claude MCPs.
 Provides a unified shell execution function with safety guards.
 """
 
+import os
+import selectors
 import subprocess
 import re
+import shlex
+import time
 from pathlib import Path
-from typing import Tuple
+from typing import List, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,29 @@ PROTECTED_CONTAINERS = [
     'super-claude',          # Base name last
 ]
 
+# Bytes kept from each of stdout and stderr; the rest is read and dropped
+MAX_OUTPUT = 1024 * 1024
+READ_CHUNK = 64 * 1024
+
+# Substrings at least one of which every blocked command must contain;
+# commands with none of them skip the regexes. Keep in step with
+# BLOCKED_PATTERNS and the docker checks below.
+_DANGER_TOKENS = ('rm', 'mkfs', 'of=/', '/dev/sd', 'docker', '};:')
+
+# Compiled once at import: all blocked patterns as one alternation, each in
+# a named group so a match can be traced back to its pattern
+_BLOCKED_RE = re.compile('|'.join(
+    f'(?P<p{i}>{pattern})' for i, pattern in enumerate(BLOCKED_PATTERNS)
+))
+
+# All protected containers in one pattern, so the command is scanned once
+# however many there are; group 1 is the docker verb, group 2 the container
+_PROTECTED_RE = re.compile(
+    r'\bdocker\s+(stop|rm)\s+('
+    + '|'.join(re.escape(c) for c in sorted(PROTECTED_CONTAINERS, key=len, reverse=True))
+    + r')(?:\s|$|;|&|\|)'
+)
+
 
 def is_command_blocked(command: str) -> Tuple[bool, str]:
     """
@@ -50,26 +77,81 @@ def is_command_blocked(command: str) -> Tuple[bool, str]:
     """
     command_lower = command.lower()
     
+    # Fast path for the common, harmless command
+    if not any(token in command_lower for token in _DANGER_TOKENS):
+        return False, ""
+    
     # Check blocked patterns
-    for pattern in BLOCKED_PATTERNS:
-        if re.search(pattern, command_lower):
-            return True, f"Command matches blocked pattern: {pattern}"
+    match = _BLOCKED_RE.search(command_lower)
+    if match:
+        pattern = BLOCKED_PATTERNS[int(match.lastgroup[1:])]
+        return True, f"Command matches blocked pattern: {pattern}"
     
     # Check for attempts to stop/rm protected containers
-    # Use regex with word boundary to avoid false positives
-    for container in PROTECTED_CONTAINERS:
-        # Pattern matches: docker stop <container> (with word boundary after)
-        stop_pattern = rf'\bdocker\s+stop\s+{re.escape(container)}(?:\s|$|;|&|\|)'
-        rm_pattern = rf'\bdocker\s+rm\s+{re.escape(container)}(?:\s|$|;|&|\|)'
-        
-        if re.search(stop_pattern, command_lower):
+    # Patterns end on a separator to avoid false positives
+    match = _PROTECTED_RE.search(command_lower)
+    if match:
+        verb, container = match.groups()
+        if verb == 'stop':
             return True, f"Cannot stop protected container: {container}"
-        if re.search(rm_pattern, command_lower):
-            return True, f"Cannot remove protected container: {container}"
+        return True, f"Cannot remove protected container: {container}"
     
     return False, ""
 
 
+def _communicate(proc: subprocess.Popen, timeout: float) -> Tuple[str, str, bool]:
+    """
+    Read a process's stdout and stderr until it exits or the timeout passes.
+    
+    Each stream keeps at most MAX_OUTPUT bytes. Anything past that is still
+    read, so the process never stalls on a full pipe, but is dropped.
+    
+    Args:
+        proc: Process started with stdout and stderr as pipes
+        timeout: Seconds to wait in total
+        
+    Returns:
+        Tuple of (stdout, stderr, timed_out)
+    """
+    buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    truncated = set()
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    
+    with selectors.DefaultSelector() as selector:
+        for stream in buffers:
+            selector.register(stream, selectors.EVENT_READ)
+        
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, READ_CHUNK)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+                buffer = buffers[key.fileobj]
+                room = MAX_OUTPUT - len(buffer)
+                if len(chunk) > room:
+                    truncated.add(key.fileobj)
+                    chunk = chunk[:max(room, 0)]
+                buffer += chunk
+    
+    if not timed_out:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+    
+    def decode(stream) -> str:
+        text = buffers[stream].decode('utf-8', errors='replace')
+        return text + "\n... [truncated]" if stream in truncated else text
+    
+    return decode(proc.stdout), decode(proc.stderr), timed_out
+
+
 def run_shell(
     command: str,
     timeout: int = 30,
@@ -100,28 +182,85 @@ def run_shell(
             logger.warning(f"Blocked command: {command} - {reason}")
             return False, f"❌ Command blocked for safety: {reason}"
     
+    return _run_process(command, timeout, cwd)
+
+
+def run_argv(
+    argv: List[str],
+    timeout: int = 30,
+    cwd: Path = None,
+    check_blocked: bool = True
+) -> Tuple[bool, str]:
+    """
+    Execute a program directly, without a shell.
+    
+    Skips the /bin/sh process and its parsing, and arguments are passed
+    as-is so they can't inject shell syntax. Use run_shell for commands
+    that need pipes, redirection or globbing.
+    
+    Args:
+        argv: Program and arguments (e.g., ["docker", "logs", name])
+        timeout: Timeout in seconds (default: 30)
+        cwd: Working directory (default: /data)
+        check_blocked: Whether to check against blocked patterns (default: True)
+        
+    Returns:
+        Tuple of (success, output)
+    """
+    from config import SUPER_CLAUDE_ROOT
+    
+    if cwd is None:
+        cwd = SUPER_CLAUDE_ROOT
+    
+    # Safety check, against the command as a shell would have seen it
+    if check_blocked:
+        command = shlex.join(argv)
+        blocked, reason = is_command_blocked(command)
+        if blocked:
+            logger.warning(f"Blocked command: {command} - {reason}")
+            return False, f"❌ Command blocked for safety: {reason}"
+    
+    return _run_process(argv, timeout, cwd)
+
+
+def _run_process(args: Union[str, List[str]], timeout: int, cwd: Path) -> Tuple[bool, str]:
+    """Run a shell command string or an argv list and format its result."""
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = subprocess.Popen(
+            args,
+            shell=isinstance(args, str),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             cwd=str(cwd)
         )
-        
-        output = result.stdout
-        if result.stderr:
-            output += f"\n[stderr]\n{result.stderr}"
-        if result.returncode != 0:
-            output += f"\n[exit code: {result.returncode}]"
-            
-        return result.returncode == 0, output.strip() or "(no output)"
-        
-    except subprocess.TimeoutExpired:
-        return False, f"❌ Command timed out after {timeout}s"
     except Exception as e:
         return False, f"❌ Error: {e}"
+    
+    try:
+        stdout, stderr, timed_out = _communicate(proc, timeout)
+    except Exception as e:
+        return False, f"❌ Error: {e}"
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+    
+    output = stdout
+    if stderr:
+        output += f"\n[stderr]\n{stderr}"
+    
+    if timed_out:
+        message = f"❌ Command timed out after {timeout}s"
+        if output.strip():
+            message += f"\n[partial output]\n{output.strip()}"
+        return False, message
+    
+    if proc.returncode != 0:
+        output += f"\n[exit code: {proc.returncode}]"
+        
+    return proc.returncode == 0, output.strip() or "(no output)"
 
 
 def run_shell_simple(command: str, timeout: int = 30) -> str: